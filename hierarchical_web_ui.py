@@ -12,7 +12,6 @@ from typing import Dict, Any, List, Optional
 import asyncio
 from datetime import datetime
 import sys
-import yaml
 
 # Import project modules
 from src.core.configurable_agent import ConfigurableAgent
@@ -30,10 +29,15 @@ from src.monitoring.performance_dashboard import PerformanceDashboard
 
 # Import new dynamic builder components
 from src.ui.enhanced_agent_library import EnhancedAgentLibrary
+from src.ui.agent_role_classifier import DEFAULT_CLASSIFICATION_CACHE
 from src.ui.team_composition_interface import TeamCompositionInterface
 from src.ui.simple_team_builder import SimpleTeamBuilder
 from src.config.dynamic_template_generator import DynamicTemplateGenerator
 
+# Prefer the libyaml C implementations when PyYAML was built with them
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Page configuration
 st.set_page_config(
     page_title="Hierarchical Agent Teams",
@@ -237,61 +241,6 @@ st.markdown("""
         border-color: #0056b3;
     }
 </style>
-
-<script>
-function fixTextColors() {
-    // Fix all textarea elements
-    document.querySelectorAll('textarea').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix all input elements
-    document.querySelectorAll('input[type="text"], input[type="number"]').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix all select elements
-    document.querySelectorAll('select').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix ONLY the specific problematic areas
-    document.querySelectorAll('.coordinator-card, .coordinator-card p, .coordinator-card h4, .worker-card, .worker-card p, .worker-card strong, .worker-card em, .worker-card small').forEach(function(el) {
-        if (el.style.color === 'white' || el.style.color === '#ffffff' || el.style.color === 'rgb(255, 255, 255)' || !el.style.color) {
-            el.style.color = '#000000';
-        }
-    });
-    
-    // Fix all text inside coordinator, worker, and team cards
-    document.querySelectorAll('.coordinator-card *, .worker-card *, .team-card *').forEach(function(el) {
-        if (el.style.color === 'white' || el.style.color === '#ffffff' || el.style.color === 'rgb(255, 255, 255)' || !el.style.color) {
-            el.style.color = '#000000';
-        }
-    });
-    
-    // Fix specific text elements that might be white
-    document.querySelectorAll('.coordinator-card strong, .coordinator-card small, .team-card strong, .team-card small, .worker-card strong, .worker-card small, .worker-card em').forEach(function(el) {
-        if (el.style.color === 'white' || el.style.color === '#ffffff' || el.style.color === 'rgb(255, 255, 255)' || !el.style.color) {
-            el.style.color = '#000000';
-        }
-    });
-    
-    // Fix only form inputs that are white on white
-    document.querySelectorAll('.stTextArea textarea, .stTextInput input, .stSelectbox select, .stNumberInput input, .stMultiselect select').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-}
-
-// Run on page load
-document.addEventListener('DOMContentLoaded', fixTextColors);
-
-// Run periodically to catch dynamically added elements
-setInterval(fixTextColors, 1000);
-</script>
 """, unsafe_allow_html=True)
 
 # Initialize session state for hierarchical teams
@@ -312,7 +261,9 @@ def initialize_session_state():
     
     # Initialize new dynamic builder components
     if 'enhanced_agent_library' not in st.session_state:
-        st.session_state.enhanced_agent_library = EnhancedAgentLibrary()
+        st.session_state.enhanced_agent_library = EnhancedAgentLibrary(
+            classification_cache=str(DEFAULT_CLASSIFICATION_CACHE)
+        )
     if 'team_composition_interface' not in st.session_state:
         st.session_state.team_composition_interface = TeamCompositionInterface(st.session_state.enhanced_agent_library)
     if 'simple_team_builder' not in st.session_state:
@@ -331,7 +282,7 @@ def load_agent_library():
         for config_file in configs_dir.glob("*.yml"):
             try:
                 with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=YamlLoader)
                     
                 agent_info = config_data.get('agent', {})
                 library[config_file.stem] = {
@@ -432,7 +383,7 @@ def render_advanced_builder_sidebar():
         try:
             team_config = st.session_state.dynamic_template_generator.generate_template_from_task(task_description)
             yaml_content = st.session_state.dynamic_template_generator.generate_yaml_config(team_config)
-            st.session_state.hierarchical_config = yaml.safe_load(yaml_content)
+            st.session_state.hierarchical_config = yaml.load(yaml_content, Loader=YamlLoader)
             st.session_state.selected_template = "Auto-Generated"
             st.sidebar.success("✅ Team auto-generated!")
             st.rerun()
@@ -473,7 +424,7 @@ def render_dynamic_builder_sidebar():
         try:
             team_config = st.session_state.dynamic_template_generator.generate_template_from_task(task_description)
             yaml_content = st.session_state.dynamic_template_generator.generate_yaml_config(team_config)
-            st.session_state.hierarchical_config = yaml.safe_load(yaml_content)
+            st.session_state.hierarchical_config = yaml.load(yaml_content, Loader=YamlLoader)
             st.session_state.selected_template = "Auto-Generated"
             st.sidebar.success("✅ Team auto-generated!")
             st.rerun()
@@ -997,7 +948,7 @@ def save_hierarchical_config():
     save_path = save_dir / filename
     try:
         with open(save_path, 'w') as f:
-            yaml.dump(st.session_state.hierarchical_config, f, default_flow_style=False, indent=2)
+            yaml.dump(st.session_state.hierarchical_config, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
         
         st.success(f"✅ Configuration saved to {save_path}")
         
@@ -1024,7 +975,7 @@ def test_hierarchical_team():
     # Save config to temporary file for testing
     try:
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(st.session_state.hierarchical_config, f, default_flow_style=False)
+            yaml.dump(st.session_state.hierarchical_config, f, Dumper=YamlDumper, default_flow_style=False)
             temp_config_path = f.name
         
         # Load and validate configuration
@@ -1111,7 +1062,7 @@ def render_configuration_management():
         
         if uploaded_file is not None:
             try:
-                config_data = yaml.safe_load(uploaded_file.read())
+                config_data = yaml.load(uploaded_file.read(), Loader=YamlLoader)
                 st.session_state.hierarchical_config = config_data
                 st.success(f"✅ Loaded configuration from {uploaded_file.name}")
                 st.rerun()
@@ -1122,7 +1073,7 @@ def render_configuration_management():
         st.write("**Export Configuration**")
         if st.session_state.hierarchical_config:
             config_yaml = yaml.dump(st.session_state.hierarchical_config, 
-                                   default_flow_style=False, indent=2)
+                                   Dumper=YamlDumper, default_flow_style=False, indent=2)
             
             st.download_button(
                 label="📥 Download Configuration",
@@ -1140,7 +1091,7 @@ def render_configuration_management():
         if st.session_state.hierarchical_config:
             try:
                 with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-                    yaml.dump(st.session_state.hierarchical_config, f, default_flow_style=False)
+                    yaml.dump(st.session_state.hierarchical_config, f, Dumper=YamlDumper, default_flow_style=False)
                     temp_path = f.name
                 
                 loader = HierarchicalConfigLoader()
@@ -1180,7 +1131,7 @@ def render_configuration_management():
                 with st.expander(f"📋 {template_file.stem}"):
                     try:
                         with open(template_file, 'r') as f:
-                            template_data = yaml.safe_load(f)
+                            template_data = yaml.load(f, Loader=YamlLoader)
                         
                         team_info = template_data.get('team', {})
                         st.write(f"**Name:** {team_info.get('name', 'Unknown')}")
@@ -1196,7 +1147,7 @@ def render_configuration_management():
                         
                         with col2:
                             if st.button(f"View YAML", key=f"view_{template_file.stem}"):
-                                st.code(yaml.dump(template_data, default_flow_style=False), 
+                                st.code(yaml.dump(template_data, Dumper=YamlDumper, default_flow_style=False), 
                                         language='yaml')
                     
                     except Exception as e:
@@ -1218,7 +1169,7 @@ def render_configuration_management():
         
         if comparison_file is not None:
             try:
-                comparison_config = yaml.safe_load(comparison_file.read())
+                comparison_config = yaml.load(comparison_file.read(), Loader=YamlLoader)
                 
                 st.write("**Configuration Differences:**")
                 
@@ -1,14 +1,63 @@
 """
 Dynamic Template Generator for Hierarchical Agent Configurations
 """
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterator, List, Optional, Set, TextIO
 from datetime import datetime
 from pathlib import Path
+import io
 import yaml
-from dataclasses import dataclass
+from yaml.events import (
+    StreamStartEvent, StreamEndEvent, DocumentStartEvent, DocumentEndEvent,
+    MappingStartEvent, MappingEndEvent, SequenceStartEvent, SequenceEndEvent, ScalarEvent
+)
+from yaml.nodes import ScalarNode
+from dataclasses import dataclass, asdict
+from itertools import islice
 
 from ..ui.agent_role_classifier import AgentRole, AgentCapability
 from ..ui.enhanced_agent_library import EnhancedAgentLibrary
+from .result_cache import ResultCache, content_key
+
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+_representer = yaml.representer.SafeRepresenter()
+_resolver = yaml.resolver.Resolver()
+
+
+def _document_events(data: Any) -> Iterator[yaml.Event]:
+    """Yield the emitter events for a single block-style YAML document."""
+    yield StreamStartEvent()
+    yield DocumentStartEvent(explicit=False)
+    yield from _node_events(data)
+    yield DocumentEndEvent(explicit=False)
+    yield StreamEndEvent()
+
+
+def _node_events(data: Any) -> Iterator[yaml.Event]:
+    """Yield emitter events for a plain dict/list/scalar tree without building a node graph."""
+    if isinstance(data, dict):
+        yield MappingStartEvent(None, _MAP_TAG, True, flow_style=False)
+        for key, value in data.items():
+            # None values mark comment placeholders and are left out of the output
+            if value is None:
+                continue
+            yield from _node_events(key)
+            yield from _node_events(value)
+        yield MappingEndEvent()
+    elif isinstance(data, list):
+        yield SequenceStartEvent(None, _SEQ_TAG, True, flow_style=False)
+        for item in data:
+            yield from _node_events(item)
+        yield SequenceEndEvent()
+    else:
+        node = _representer.represent_data(data)
+        implicit = (
+            node.tag == _resolver.resolve(ScalarNode, node.value, (True, False)),
+            node.tag == _resolver.resolve(ScalarNode, node.value, (False, True))
+        )
+        yield ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
 
 
 @dataclass
@@ -51,6 +100,7 @@ class DynamicTemplateGenerator:
     
     def __init__(self, agent_library: Optional[EnhancedAgentLibrary] = None):
         self.agent_library = agent_library or EnhancedAgentLibrary()
+        self._validation_cache = ResultCache(max_entries=256)
         self.routing_strategies = [
             "keyword_based",
             "llm_based", 
@@ -155,6 +205,17 @@ class DynamicTemplateGenerator:
     
     def generate_yaml_config(self, team_config: HierarchicalTeamConfig) -> str:
         """Generate YAML configuration from team config."""
+        out = io.StringIO()
+        self.generate_yaml_stream(team_config, out)
+        return out.getvalue()
+    
+    def generate_yaml_stream(self, team_config: HierarchicalTeamConfig, out: TextIO):
+        """Emit the YAML configuration for a team config directly into a text stream."""
+        config = self._build_config(team_config)
+        yaml.emit(_document_events(config), out, Dumper=YamlDumper, indent=2)
+    
+    def _build_config(self, team_config: HierarchicalTeamConfig) -> Dict[str, Any]:
+        """Build the configuration structure for a team config."""
         
         # Build the configuration structure
         config = {
@@ -272,14 +333,7 @@ class DynamicTemplateGenerator:
             }
         }
         
-        # Convert to YAML string
-        yaml_str = yaml.dump(config, default_flow_style=False, indent=2, sort_keys=False)
-        
-        # Clean up the YAML (remove None values for comments)
-        lines = yaml_str.split('\n')
-        cleaned_lines = [line for line in lines if not line.strip().endswith(': null')]
-        
-        return '\n'.join(cleaned_lines)
+        return config
     
     def _get_llm_config_from_agent(self, agent_id: str) -> Dict[str, Any]:
         """Get LLM configuration from agent config file."""
@@ -347,7 +401,7 @@ class DynamicTemplateGenerator:
             
             if worker_id:
                 # Group by primary capability or specialization
-                primary_capability = list(worker.capabilities)[0].value if worker.capabilities else "general"
+                primary_capability = next(iter(worker.capabilities)).value if worker.capabilities else "general"
                 if primary_capability not in workers_by_spec:
                     workers_by_spec[primary_capability] = []
                 workers_by_spec[primary_capability].append(worker_id)
@@ -387,7 +441,7 @@ class DynamicTemplateGenerator:
             capabilities = set()
             for worker in suggestions.get("workers", []):
                 capabilities.update([cap.value for cap in worker.capabilities])
-            team_name = f"Dynamic {', '.join(list(capabilities)[:2]).title()} Team"
+            team_name = f"Dynamic {', '.join(islice(capabilities, 2)).title()} Team"
         
         return self.create_team_config(
             team_name=team_name,
@@ -418,6 +472,11 @@ class DynamicTemplateGenerator:
     
     def validate_template(self, team_config: HierarchicalTeamConfig) -> Dict[str, Any]:
         """Validate a team template configuration."""
+        key = content_key("validate_template", self.agent_library.version, asdict(team_config))
+        return self._validation_cache.get_or_compute(key, lambda: self._validate_template(team_config))
+    
+    def _validate_template(self, team_config: HierarchicalTeamConfig) -> Dict[str, Any]:
+        """Run template validation without consulting the cache."""
         validation = {
             "valid": True,
             "errors": [],
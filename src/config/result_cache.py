@@ -0,0 +1,53 @@
+"""
+Content-hash keyed LRU cache for validation and preview results
+"""
+from typing import Any, Callable
+from collections import OrderedDict
+import copy
+import hashlib
+import json
+
+try:
+    import orjson
+
+    def _canonical_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+except ImportError:
+    def _canonical_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def content_key(*parts: Any) -> bytes:
+    """Hash JSON-compatible parts into a compact, order-independent cache key."""
+    return hashlib.blake2b(_canonical_bytes(parts), digest_size=16).digest()
+
+
+class ResultCache:
+    """Small LRU cache mapping content keys to previously computed results.
+
+    Callers get their own deep copy of a result, so mutating it can't corrupt
+    the cache. A compute function that raises stores nothing.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def get_or_compute(self, key: bytes, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for key, computing and storing it on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return copy.deepcopy(self._entries[key])
+
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def clear(self):
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,10 +2,10 @@
 Main configurable agent class that ties everything together.
 """
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage, BaseMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, BaseMessage
 from langchain_core.runnables import Runnable
 
 from langgraph.prebuilt import create_react_agent
@@ -19,6 +19,16 @@ from ..memory.memory_manager import MemoryManager
 load_dotenv()
 
 
+def _chunk_text(content: Any) -> str:
+    """Text of a streamed message chunk; some providers send a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content or []
+    )
+
+
 class ConfigurableAgent:
     """Main configurable agent class."""
     
@@ -143,25 +153,32 @@ class ConfigurableAgent:
         self.system_prompt = system_prompt
         self.available_tools = tools
     
-    def run(self, input_text: str, **kwargs) -> Dict[str, Any]:
-        """Run the agent with given input."""
-        if not self.graph:
-            raise ValueError("Graph not initialized")
+    def _prepare_messages(self, input_text: str) -> Tuple[List[BaseMessage], HumanMessage]:
+        """Build the system and user messages for a run, adding memory context if available.
         
-        # Add memory context if available
+        Returns the messages along with the user message, which is what gets recorded in memory.
+        """
         enhanced_input = input_text
         if self.memory_manager:
             memory_context = self.memory_manager.get_relevant_context(input_text)
             if memory_context:
                 enhanced_input = f"{input_text}\n\nRelevant context: {memory_context}"
         
+        messages = []
+        if hasattr(self, 'system_prompt') and self.system_prompt:
+            messages.append(SystemMessage(content=self.system_prompt))
+        user_message = HumanMessage(content=enhanced_input)
+        messages.append(user_message)
+        return messages, user_message
+    
+    def run(self, input_text: str, **kwargs) -> Dict[str, Any]:
+        """Run the agent with given input."""
+        if not self.graph:
+            raise ValueError("Graph not initialized")
+        
+        messages, user_message = self._prepare_messages(input_text)
+        
         try:
-            # Prepare messages with system prompt
-            messages = []
-            if hasattr(self, 'system_prompt') and self.system_prompt:
-                messages.append(SystemMessage(content=self.system_prompt))
-            messages.append(HumanMessage(content=enhanced_input))
-            
             # Handle Groq differently - use direct LLM call instead of ReAct
             if self.config.llm.provider.lower() == "groq":
                 # For Groq, use direct LLM call without tools to avoid function calling issues
@@ -194,11 +211,8 @@ class ConfigurableAgent:
                     message_contents.append(str(msg))
             
             # Store interaction in memory if available
-            if self.memory_manager and messages:
-                user_msg = messages[0] if messages else HumanMessage(content=input_text)
-                ai_response = last_message if last_message else None
-                if ai_response:
-                    self.memory_manager.store_interaction([user_msg], ai_response)
+            if self.memory_manager and last_message:
+                self.memory_manager.store_interaction([user_message], last_message)
             
             response = {
                 "response": response_text,
@@ -247,20 +261,9 @@ class ConfigurableAgent:
         if not self.graph:
             raise ValueError("Graph not initialized")
         
-        # Add memory context if available
-        enhanced_input = input_text
-        if self.memory_manager:
-            memory_context = self.memory_manager.get_relevant_context(input_text)
-            if memory_context:
-                enhanced_input = f"{input_text}\n\nRelevant context: {memory_context}"
+        messages, user_message = self._prepare_messages(input_text)
         
         try:
-            # Prepare messages with system prompt
-            messages = []
-            if hasattr(self, 'system_prompt') and self.system_prompt:
-                messages.append(SystemMessage(content=self.system_prompt))
-            messages.append(HumanMessage(content=enhanced_input))
-            
             # Handle Groq differently - use direct LLM call instead of ReAct
             if self.config.llm.provider.lower() == "groq":
                 # For Groq, use direct LLM call without tools to avoid function calling issues
@@ -293,11 +296,8 @@ class ConfigurableAgent:
                     message_contents.append(str(msg))
             
             # Store interaction in memory if available
-            if self.memory_manager and messages:
-                user_msg = messages[0] if messages else HumanMessage(content=input_text)
-                ai_response = last_message if last_message else None
-                if ai_response:
-                    self.memory_manager.store_interaction([user_msg], ai_response)
+            if self.memory_manager and last_message:
+                self.memory_manager.store_interaction([user_message], last_message)
             
             response = {
                 "response": response_text,
@@ -319,6 +319,35 @@ class ConfigurableAgent:
                 "metadata": {}
             }
     
+    def stream(self, input_text: str) -> Iterator[str]:
+        """Run the agent, yielding response text as the model produces it."""
+        if not self.graph:
+            raise ValueError("Graph not initialized")
+        
+        messages, user_message = self._prepare_messages(input_text)
+        
+        # Groq uses a direct LLM call, matching run()
+        if self.config.llm.provider.lower() == "groq":
+            chunks = self.llm.stream(messages)
+        else:
+            chunks = (chunk for chunk, _ in self.graph.stream({"messages": messages}, stream_mode="messages"))
+        
+        response_text = ""
+        for chunk in chunks:
+            if not isinstance(chunk, AIMessageChunk):
+                # Tool output ends the current model turn; only the last turn is the answer
+                response_text = ""
+                continue
+            
+            text = _chunk_text(chunk.content)
+            if text:
+                response_text += text
+                yield text
+        
+        # Store interaction in memory if available
+        if self.memory_manager and response_text:
+            self.memory_manager.store_interaction([user_message], AIMessage(content=response_text))
+    
     def get_prompt_template(self, prompt_type: str, **variables) -> str:
         """Get a formatted prompt template."""
         return self.config_loader.get_prompt_template(prompt_type, **variables)
@@ -2,13 +2,58 @@
 Memory management integration with LangMem for configurable agents.
 """
 import json
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from langchain_core.messages import BaseMessage
 import hashlib
 
 from ..core.config_loader import MemoryConfig
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _overlap_scores(query_ids, corpus_offsets, corpus_ids):
+        """Count shared token ids between the query and each CSR-packed document."""
+        n_docs = corpus_offsets.shape[0] - 1
+        scores = np.zeros(n_docs, dtype=np.int32)
+        for doc in range(n_docs):
+            count = 0
+            for j in range(corpus_offsets[doc], corpus_offsets[doc + 1]):
+                token = corpus_ids[j]
+                for q in range(query_ids.shape[0]):
+                    if query_ids[q] == token:
+                        count += 1
+                        break
+            scores[doc] = count
+        return scores
+
 
 class MemoryManager:
     """Manages agent memory using LangMem integration."""
@@ -20,6 +65,18 @@ class MemoryManager:
         self.procedural_memory = {}
         self.memory_store = {}
         
+        # Token vocabulary and per-text token id cache for the numba scoring path
+        self._vocab: Dict[str, int] = {}
+        self._token_ids: Dict[str, Any] = {}
+        
+        # Memory enablement is fixed for the manager's lifetime, so bind no-op
+        # fast paths once instead of checking the flag on every call
+        if not self.config.enabled:
+            self.store_interaction = self._skip_store
+            self.store_memory = self._skip_store
+            self.retrieve_memory = self._skip_retrieve
+            self.get_relevant_context = self._skip_context
+        
         # Initialize based on configuration
         self._initialize_memory_backend()
     
@@ -39,15 +96,11 @@ class MemoryManager:
     
     def store_interaction(self, messages: List[BaseMessage], response: BaseMessage):
         """Store an interaction in memory."""
-        if not self.config.enabled:
-            return
-        
         interaction_id = self._generate_interaction_id(messages, response)
-        timestamp = datetime.now()
         
         interaction = {
             "id": interaction_id,
-            "timestamp": timestamp.isoformat(),
+            "timestamp": time.time(),
             "messages": [self._message_to_dict(msg) for msg in messages],
             "response": self._message_to_dict(response),
             "metadata": {}
@@ -68,9 +121,6 @@ class MemoryManager:
     
     def retrieve_memory(self, query: str, memory_type: str = "all") -> Dict[str, Any]:
         """Retrieve relevant memory based on query."""
-        if not self.config.enabled:
-            return {}
-        
         relevant_memory = {}
         
         if memory_type in ["all", "semantic"] and self.config.types.semantic:
@@ -109,20 +159,28 @@ class MemoryManager:
     
     def store_memory(self, content: BaseMessage):
         """Store individual memory item."""
-        if not self.config.enabled:
-            return
-        
         memory_id = self._generate_memory_id(content)
         
         memory_item = {
             "id": memory_id,
             "content": self._message_to_dict(content),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "type": "manual_storage"
         }
         
         self.memory_store[memory_id] = memory_item
     
+    def _skip_store(self, *args, **kwargs):
+        """Discard a store request while memory is disabled."""
+    
+    def _skip_retrieve(self, *args, **kwargs) -> Dict[str, Any]:
+        """Return no memory while memory is disabled."""
+        return {}
+    
+    def _skip_context(self, *args, **kwargs) -> str:
+        """Return no context while memory is disabled."""
+        return ""
+    
     def _extract_semantic_info(self, messages: List[BaseMessage], response: BaseMessage):
         """Extract semantic information from interaction."""
         # Simple semantic extraction (in real implementation, this would use NLP)
@@ -138,45 +196,63 @@ class MemoryManager:
                     self.semantic_memory[fact_id] = {
                         "fact": fact,
                         "confidence": 0.8,
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": time.time()
                     }
     
     def _search_semantic_memory(self, query: str) -> List[str]:
         """Search semantic memory for relevant facts."""
-        query_words = set(query.lower().split())
-        relevant_facts = []
-        
-        for fact_data in self.semantic_memory.values():
-            fact_words = set(fact_data["fact"].lower().split())
-            # Simple word overlap scoring
-            overlap = len(query_words.intersection(fact_words))
-            if overlap > 0:
-                relevant_facts.append((fact_data["fact"], overlap))
+        facts = [fact_data["fact"] for fact_data in self.semantic_memory.values()]
         
-        # Sort by relevance and return top facts
-        relevant_facts.sort(key=lambda x: x[1], reverse=True)
-        return [fact[0] for fact in relevant_facts[:5]]
+        # Simple word overlap scoring, sorted by relevance
+        relevant_facts = self._rank_by_overlap(query, facts)
+        return [facts[i] for i, _ in relevant_facts[:5]]
     
     def _search_episodic_memory(self, query: str) -> List[Dict[str, Any]]:
         """Search episodic memory for relevant interactions."""
-        query_words = set(query.lower().split())
-        relevant_episodes = []
-        
-        for episode in self.episodic_memory:
-            # Search in all messages of the episode
-            episode_text = " ".join([
-                msg["content"] for msg in episode["messages"]
-            ] + [episode["response"]["content"]])
-            
-            episode_words = set(episode_text.lower().split())
-            overlap = len(query_words.intersection(episode_words))
-            
-            if overlap > 0:
-                relevant_episodes.append((episode, overlap))
+        # Search in all messages of each episode
+        episode_texts = [
+            " ".join([msg["content"] for msg in episode["messages"]] + [episode["response"]["content"]])
+            for episode in self.episodic_memory
+        ]
         
         # Sort by relevance and return top episodes
-        relevant_episodes.sort(key=lambda x: x[1], reverse=True)
-        return [ep[0] for ep in relevant_episodes[:3]]
+        relevant_episodes = self._rank_by_overlap(query, episode_texts)
+        return [self.episodic_memory[i] for i, _ in relevant_episodes[:3]]
+    
+    def _rank_by_overlap(self, query: str, texts: List[str]) -> List[Tuple[int, int]]:
+        """Rank texts by word overlap with the query, returning (index, overlap) pairs."""
+        if NUMBA_AVAILABLE and texts:
+            doc_ids = [self._encode_tokens(text) for text in texts]
+            query_ids = np.array(
+                [self._vocab[word] for word in set(query.lower().split()) if word in self._vocab],
+                dtype=np.int32
+            )
+            offsets = np.zeros(len(doc_ids) + 1, dtype=np.int32)
+            np.cumsum([len(ids) for ids in doc_ids], out=offsets[1:])
+            scores = _overlap_scores(query_ids, offsets, np.concatenate(doc_ids))
+            ranked = [(i, int(score)) for i, score in enumerate(scores) if score > 0]
+        else:
+            query_words = set(query.lower().split())
+            ranked = []
+            for i, text in enumerate(texts):
+                overlap = len(query_words.intersection(text.lower().split()))
+                if overlap > 0:
+                    ranked.append((i, overlap))
+        
+        ranked.sort(key=lambda x: x[1], reverse=True)
+        return ranked
+    
+    def _encode_tokens(self, text: str):
+        """Map the unique lowercase words of a text to an int32 id array."""
+        ids = self._token_ids.get(text)
+        if ids is None:
+            words = set(text.lower().split())
+            ids = np.array(
+                [self._vocab.setdefault(word, len(self._vocab)) for word in words],
+                dtype=np.int32
+            )
+            self._token_ids[text] = ids
+        return ids
     
     def _update_procedural_memory(self, messages: List[BaseMessage], response: BaseMessage):
         """Update procedural memory based on successful patterns."""
@@ -193,7 +269,7 @@ class MemoryManager:
                     self.procedural_memory[pattern_id] = {
                         "pattern": pattern,
                         "success_count": 1,
-                        "last_used": datetime.now().isoformat()
+                        "last_used": time.time()
                     }
     
     def _get_procedural_memory(self, query: str) -> Dict[str, Any]:
@@ -216,12 +292,23 @@ class MemoryManager:
             # Remove oldest episodes
             self.episodic_memory = self.episodic_memory[-self.config.settings.max_memory_size:]
         
-        # Remove episodes older than retention period
-        cutoff_date = datetime.now() - timedelta(days=self.config.settings.retention_days)
+        # Remove episodes older than retention period (timestamps are epoch seconds)
+        cutoff = time.time() - timedelta(days=self.config.settings.retention_days).total_seconds()
         self.episodic_memory = [
             episode for episode in self.episodic_memory
-            if datetime.fromisoformat(episode["timestamp"]) > cutoff_date
+            if episode["timestamp"] > cutoff
         ]
+        
+        self._prune_token_cache()
+    
+    def _prune_token_cache(self):
+        """Drop cached token ids once they mostly belong to texts no longer in memory."""
+        # Ids are only meaningful against the current vocabulary, so both are
+        # rebuilt together on the next search rather than evicted entry by entry
+        live_texts = len(self.episodic_memory) + len(self.semantic_memory)
+        if len(self._token_ids) > 2 * live_texts:
+            self._vocab.clear()
+            self._token_ids.clear()
     
     def _generate_interaction_id(self, messages: List[BaseMessage], response: BaseMessage) -> str:
         """Generate unique ID for interaction."""
@@ -259,27 +346,78 @@ class MemoryManager:
         self.episodic_memory.clear()
         self.procedural_memory.clear()
         self.memory_store.clear()
+        self._vocab.clear()
+        self._token_ids.clear()
     
     def export_history(self, format_type: str = "json") -> str:
         """Export memory history."""
-        history = {
-            "semantic_memory": self.semantic_memory,
-            "episodic_memory": self.episodic_memory,
-            "procedural_memory": self.procedural_memory,
-            "memory_store": self.memory_store,
-            "export_timestamp": datetime.now().isoformat()
-        }
+        history = self._build_history()
         
         if format_type.lower() == "json":
-            return json.dumps(history, indent=2)
+            return _dumps(history)
         else:
             return str(history)
     
     def import_history(self, history_data: str, format_type: str = "json"):
         """Import memory history."""
         if format_type.lower() == "json":
-            data = json.loads(history_data)
-            self.semantic_memory = data.get("semantic_memory", {})
-            self.episodic_memory = data.get("episodic_memory", [])
-            self.procedural_memory = data.get("procedural_memory", {})
-            self.memory_store = data.get("memory_store", {})
\ No newline at end of file
+            self._restore_history(_loads(history_data))
+    
+    def export_history_msgpack(self) -> bytes:
+        """Export memory history as a compact msgpack payload."""
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for msgpack export: pip install msgpack")
+        return msgpack.packb(self._build_history(), use_bin_type=True)
+    
+    def import_history_msgpack(self, history_data: bytes):
+        """Import memory history from a msgpack payload."""
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required for msgpack import: pip install msgpack")
+        self._restore_history(msgpack.unpackb(history_data, raw=False))
+    
+    def _build_history(self) -> Dict[str, Any]:
+        """Collect all memory stores into a serializable history dict."""
+        return {
+            "semantic_memory": {
+                key: _with_iso_time(item, "timestamp") for key, item in self.semantic_memory.items()
+            },
+            "episodic_memory": [_with_iso_time(episode, "timestamp") for episode in self.episodic_memory],
+            "procedural_memory": {
+                key: _with_iso_time(item, "last_used") for key, item in self.procedural_memory.items()
+            },
+            "memory_store": {
+                key: _with_iso_time(item, "timestamp") for key, item in self.memory_store.items()
+            },
+            "export_timestamp": datetime.now().isoformat()
+        }
+    
+    def _restore_history(self, data: Dict[str, Any]):
+        """Replace memory stores with the contents of a history dict."""
+        self.semantic_memory = {
+            key: _with_epoch_time(item, "timestamp") for key, item in data.get("semantic_memory", {}).items()
+        }
+        self.episodic_memory = [
+            _with_epoch_time(episode, "timestamp") for episode in data.get("episodic_memory", [])
+        ]
+        self.procedural_memory = {
+            key: _with_epoch_time(item, "last_used") for key, item in data.get("procedural_memory", {}).items()
+        }
+        self.memory_store = {
+            key: _with_epoch_time(item, "timestamp") for key, item in data.get("memory_store", {}).items()
+        }
+
+
+def _with_iso_time(record: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """Return a copy of a record with an epoch-seconds field rendered as ISO 8601."""
+    value = record.get(field)
+    if isinstance(value, (int, float)):
+        return {**record, field: datetime.fromtimestamp(value).isoformat()}
+    return record
+
+
+def _with_epoch_time(record: Dict[str, Any], field: str) -> Dict[str, Any]:
+    """Return a copy of a record with an ISO 8601 field parsed back to epoch seconds."""
+    value = record.get(field)
+    if isinstance(value, str):
+        return {**record, field: datetime.fromisoformat(value).timestamp()}
+    return record
@@ -1,12 +1,38 @@
 """
 Agent Role Classifier - Categorizes agents by roles and capabilities
 """
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, List, Set, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import json
+import os
+import sys
+import tempfile
+import threading
+import weakref
 import yaml
 from pathlib import Path
 
+# libyaml's C loader releases the GIL while parsing, so threaded loads scale
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+DEFAULT_CLASSIFICATION_CACHE = Path.home() / ".cache" / "configurable_agents" / "classify.json"
+
+# Bump when classification rules or the cache layout change so stale cached results are discarded
+CLASSIFICATION_CACHE_VERSION = 2
+
+# Classifiers with unsaved results; held weakly so a discarded classifier isn't kept alive until exit
+_PENDING_CACHE_SAVES: "weakref.WeakSet[AgentRoleClassifier]" = weakref.WeakSet()
+
+
+@atexit.register
+def _save_pending_caches():
+    """Write the caches of classifiers that still have unsaved results at exit."""
+    for classifier in list(_PENDING_CACHE_SAVES):
+        classifier.save_cache()
+
 
 class AgentRole(Enum):
     """Agent role types for hierarchical teams."""
@@ -52,7 +78,13 @@ class AgentMetadata:
 class AgentRoleClassifier:
     """Classifies agents based on their configuration and capabilities."""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        # Entries keyed by absolute path, each holding the file's mtime_ns and size
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        
         self.capability_keywords = {
             AgentCapability.WEB_SEARCH: ["web_search", "search", "browse", "internet", "web"],
             AgentCapability.CODE_GENERATION: ["code", "programming", "develop", "coding", "python", "javascript"],
@@ -78,52 +110,18 @@ class AgentRoleClassifier:
     def classify_agent(self, config_path: str) -> AgentMetadata:
         """Classify an agent based on its configuration file."""
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            agent_info = config.get('agent', {})
-            name = agent_info.get('name', Path(config_path).stem)
-            description = agent_info.get('description', '')
-            
-            # Extract capabilities
-            capabilities = self._extract_capabilities(config)
-            
-            # Extract tools
-            tools = self._extract_tools(config)
+            if not self.cache_path:
+                return self._classify(config_path)
             
-            # Extract specializations
-            specializations = self._extract_specializations(config)
+            stat = os.stat(config_path)
+            cache_key = os.path.abspath(config_path)
+            cached = self._cache.get(cache_key)
+            if cached is not None and (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+                return _metadata_from_dict(cached["metadata"])
             
-            # Determine primary role
-            primary_role = self._determine_primary_role(name, description, capabilities, specializations)
-            
-            # Determine secondary roles
-            secondary_roles = self._determine_secondary_roles(name, description, capabilities, primary_role)
-            
-            # Determine supervision and coordination capabilities
-            can_supervise = self._can_supervise(capabilities, specializations, description)
-            can_coordinate = self._can_coordinate(capabilities, specializations, description)
-            
-            # Calculate compatibility score
-            compatibility_score = self._calculate_compatibility_score(capabilities, tools, specializations)
-            
-            # Determine team size limit for supervisors
-            team_size_limit = self._determine_team_size_limit(primary_role, capabilities)
-            
-            return AgentMetadata(
-                name=name,
-                description=description,
-                primary_role=primary_role,
-                secondary_roles=secondary_roles,
-                capabilities=capabilities,
-                tools=tools,
-                specializations=specializations,
-                file_path=config_path,
-                compatibility_score=compatibility_score,
-                can_supervise=can_supervise,
-                can_coordinate=can_coordinate,
-                team_size_limit=team_size_limit
-            )
+            metadata = self._classify(config_path)
+            self._store_cached(cache_key, stat, metadata)
+            return metadata
             
         except Exception as e:
             # Return basic metadata for failed classification
@@ -138,6 +136,94 @@ class AgentRoleClassifier:
                 file_path=config_path
             )
     
+    def _classify(self, config_path: str) -> AgentMetadata:
+        """Parse a configuration file and derive its agent metadata."""
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=YamlLoader)
+        
+        agent_info = config.get('agent', {})
+        name = agent_info.get('name', Path(config_path).stem)
+        description = agent_info.get('description', '')
+        
+        # Extract capabilities
+        capabilities = self._extract_capabilities(config)
+        
+        # Extract tools
+        tools = self._extract_tools(config)
+        
+        # Extract specializations
+        specializations = self._extract_specializations(config)
+        
+        # Determine primary role
+        primary_role = self._determine_primary_role(name, description, capabilities, specializations)
+        
+        # Determine secondary roles
+        secondary_roles = self._determine_secondary_roles(name, description, capabilities, primary_role)
+        
+        # Determine supervision and coordination capabilities
+        can_supervise = self._can_supervise(capabilities, specializations, description)
+        can_coordinate = self._can_coordinate(capabilities, specializations, description)
+        
+        # Calculate compatibility score
+        compatibility_score = self._calculate_compatibility_score(capabilities, tools, specializations)
+        
+        # Determine team size limit for supervisors
+        team_size_limit = self._determine_team_size_limit(primary_role, capabilities)
+        
+        return AgentMetadata(
+            name=name,
+            description=description,
+            primary_role=primary_role,
+            secondary_roles=secondary_roles,
+            capabilities=capabilities,
+            tools=tools,
+            specializations=specializations,
+            file_path=config_path,
+            compatibility_score=compatibility_score,
+            can_supervise=can_supervise,
+            can_coordinate=can_coordinate,
+            team_size_limit=team_size_limit
+        )
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted classification results, ignoring unreadable or stale caches."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") != CLASSIFICATION_CACHE_VERSION:
+                return {}
+            return data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _store_cached(self, cache_key: str, stat: os.stat_result, metadata: AgentMetadata):
+        """Record a classification result, replacing any entry for an earlier version of the file."""
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "metadata": _metadata_to_dict(metadata)}
+        with self._cache_lock:
+            self._cache[cache_key] = entry
+            self._cache_dirty = True
+        _PENDING_CACHE_SAVES.add(self)
+    
+    def save_cache(self):
+        """Atomically write pending classification results to the cache file."""
+        if not self.cache_path or not self._cache_dirty:
+            return
+        with self._cache_lock:
+            entries = dict(self._cache)
+            self._cache_dirty = False
+        _PENDING_CACHE_SAVES.discard(self)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"version": CLASSIFICATION_CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self._cache_dirty = True
+            print(f"Error saving classification cache: {e}")
+    
     def _extract_capabilities(self, config: Dict[str, Any]) -> Set[AgentCapability]:
         """Extract capabilities from agent configuration."""
         capabilities = set()
@@ -313,18 +399,39 @@ class AgentRoleClassifier:
     def classify_agents_from_directory(self, directory: str) -> Dict[str, AgentMetadata]:
         """Classify all agents in a directory."""
         agents = {}
-        configs_dir = Path(directory)
         
-        if configs_dir.exists():
-            for config_file in configs_dir.glob("*.yml"):
-                try:
-                    agent_metadata = self.classify_agent(str(config_file))
-                    agents[config_file.stem] = agent_metadata
-                except Exception as e:
-                    print(f"Error classifying {config_file}: {e}")
+        if not os.path.isdir(directory):
+            return agents
+        
+        with os.scandir(directory) as entries:
+            config_paths = [
+                entry.path for entry in entries
+                if entry.name.endswith(".yml") and entry.is_file(follow_symlinks=False)
+            ]
+        
+        if not config_paths:
+            return agents
+        
+        # Parse and classify in parallel; map() preserves the directory order
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(config_paths))) as executor:
+            results = list(executor.map(self._classify_one, config_paths))
         
+        for config_path, agent_metadata in results:
+            if agent_metadata is not None:
+                # Agent IDs key every library and composition lookup, so intern them once
+                agents[sys.intern(Path(config_path).stem)] = agent_metadata
+        
+        self.save_cache()
         return agents
     
+    def _classify_one(self, config_path: str) -> Tuple[str, Optional[AgentMetadata]]:
+        """Classify a single config file, reporting errors instead of raising."""
+        try:
+            return config_path, self.classify_agent(config_path)
+        except Exception as e:
+            print(f"Error classifying {config_path}: {e}")
+            return config_path, None
+    
     def filter_agents_by_role(self, agents: Dict[str, AgentMetadata], 
                              role: AgentRole, include_secondary: bool = True) -> Dict[str, AgentMetadata]:
         """Filter agents by role."""
@@ -375,4 +482,23 @@ class AgentRoleClassifier:
             if any(keyword in task_lower for keyword in keywords):
                 capabilities.add(capability)
         
-        return capabilities
\ No newline at end of file
+        return capabilities
+
+
+def _metadata_to_dict(metadata: AgentMetadata) -> Dict[str, Any]:
+    """Convert agent metadata to a JSON-serializable dict."""
+    data = asdict(metadata)
+    data["primary_role"] = metadata.primary_role.value
+    data["secondary_roles"] = [role.value for role in metadata.secondary_roles]
+    data["capabilities"] = [cap.value for cap in metadata.capabilities]
+    return data
+
+
+def _metadata_from_dict(data: Dict[str, Any]) -> AgentMetadata:
+    """Rebuild agent metadata from its JSON-serializable dict form."""
+    return AgentMetadata(**{
+        **data,
+        "primary_role": AgentRole(data["primary_role"]),
+        "secondary_roles": [AgentRole(role) for role in data["secondary_roles"]],
+        "capabilities": {AgentCapability(cap) for cap in data["capabilities"]}
+    })
@@ -6,21 +6,59 @@ from pathlib import Path
 import yaml
 from dataclasses import asdict
 
-from .agent_role_classifier import AgentRoleClassifier, AgentMetadata, AgentRole, AgentCapability
+from .agent_role_classifier import (
+    AgentRoleClassifier, AgentMetadata, AgentRole, AgentCapability
+)
 
 
 class EnhancedAgentLibrary:
     """Enhanced agent library with role classification and filtering capabilities."""
     
-    def __init__(self, configs_directory: str = "configs/examples"):
+    def __init__(self, configs_directory: str = "configs/examples",
+                 classification_cache: Optional[str] = None):
         self.configs_directory = Path(configs_directory)
-        self.classifier = AgentRoleClassifier()
+        self.classifier = AgentRoleClassifier(cache_path=classification_cache)
         self.agents: Dict[str, AgentMetadata] = {}
+        # Agent IDs per role in library order, primary-only and including secondary roles
+        self._primary_role_index: Dict[AgentRole, List[str]] = {}
+        self._role_index: Dict[AgentRole, List[str]] = {}
+        # Bumped on every (re)load so result caches keyed on it are invalidated
+        self.version = 0
         self.load_agents()
     
     def load_agents(self):
         """Load and classify all agents from the configurations directory."""
         self.agents = self.classifier.classify_agents_from_directory(str(self.configs_directory))
+        self._build_role_index()
+        self._build_capability_masks()
+        self.version += 1
+    
+    def _build_role_index(self):
+        """Index agent IDs by role so role filters don't rescan every agent."""
+        self._primary_role_index = {role: [] for role in AgentRole}
+        self._role_index = {role: [] for role in AgentRole}
+        
+        for agent_id, metadata in self.agents.items():
+            self._primary_role_index[metadata.primary_role].append(agent_id)
+            for role in AgentRole:
+                if role is metadata.primary_role or role in metadata.secondary_roles:
+                    self._role_index[role].append(agent_id)
+    
+    def _build_capability_masks(self):
+        """Encode each agent's capabilities as an integer bitmask (one bit per capability)."""
+        capability_bits = {capability: 1 << bit for bit, capability in enumerate(AgentCapability)}
+        self.capability_masks: Dict[str, int] = {}
+        library_mask = 0
+        
+        for agent_id, metadata in self.agents.items():
+            mask = 0
+            for capability in metadata.capabilities:
+                mask |= capability_bits[capability]
+            self.capability_masks[agent_id] = mask
+            library_mask |= mask
+        
+        # Number of distinct capabilities offered by the library as a whole (int.bit_count needs 3.10)
+        self.capability_count = bin(library_mask).count("1")
     
     def reload_agents(self):
         """Reload agents from the configurations directory."""
@@ -32,7 +70,8 @@ class EnhancedAgentLibrary:
     
     def get_agents_by_role(self, role: AgentRole, include_secondary: bool = True) -> Dict[str, AgentMetadata]:
         """Get agents filtered by role."""
-        return self.classifier.filter_agents_by_role(self.agents, role, include_secondary)
+        index = self._role_index if include_secondary else self._primary_role_index
+        return {agent_id: self.agents[agent_id] for agent_id in index[role]}
     
     def get_coordinators(self) -> Dict[str, AgentMetadata]:
         """Get agents capable of coordination."""
@@ -172,27 +211,26 @@ class EnhancedAgentLibrary:
             "coordination_capable": 0
         }
         
-        # Role statistics
-        for role in AgentRole:
-            agents_with_role = self.get_agents_by_role(role, include_secondary=False)
-            stats["roles"][role.value] = len(agents_with_role)
+        # Role keys are known up front; count primary roles and capabilities in one pass
+        role_counts = dict.fromkeys((role.value for role in AgentRole), 0)
+        capability_counts: Dict[str, int] = {}
+        total_compatibility = 0.0
         
-        # Capability statistics
-        all_capabilities = set()
         for metadata in self.agents.values():
-            all_capabilities.update(metadata.capabilities)
-        
-        for capability in all_capabilities:
-            agents_with_capability = self.get_agents_by_capability(capability)
-            stats["capabilities"][capability.value] = len(agents_with_capability)
+            role_counts[metadata.primary_role.value] += 1
+            for capability in metadata.capabilities:
+                capability_counts[capability.value] = capability_counts.get(capability.value, 0) + 1
+            if metadata.can_supervise:
+                stats["supervision_capable"] += 1
+            if metadata.can_coordinate:
+                stats["coordination_capable"] += 1
+            total_compatibility += metadata.compatibility_score
         
-        # Special capabilities
-        stats["supervision_capable"] = sum(1 for metadata in self.agents.values() if metadata.can_supervise)
-        stats["coordination_capable"] = sum(1 for metadata in self.agents.values() if metadata.can_coordinate)
+        stats["roles"] = role_counts
+        stats["capabilities"] = capability_counts
         
         # Average compatibility score
         if self.agents:
-            total_compatibility = sum(metadata.compatibility_score for metadata in self.agents.values())
             stats["average_compatibility"] = total_compatibility / len(self.agents)
         
         return stats
@@ -9,6 +9,7 @@ import json
 
 from .enhanced_agent_library import EnhancedAgentLibrary
 from ..config.dynamic_template_generator import DynamicTemplateGenerator
+from ..config.result_cache import ResultCache, content_key
 
 
 class RealTimeValidator:
@@ -17,9 +18,20 @@ class RealTimeValidator:
     def __init__(self, agent_library: EnhancedAgentLibrary, template_generator: DynamicTemplateGenerator):
         self.agent_library = agent_library
         self.template_generator = template_generator
+        # Streamlit reruns the script on every event, so identical compositions repeat constantly
+        self._cache = ResultCache(max_entries=256)
+    
+    def _cache_key(self, name: str, *parts: Any) -> bytes:
+        """Build a cache key that is invalidated whenever the agent library reloads."""
+        return content_key(name, self.agent_library.version, *parts)
         
     def validate_composition_live(self, composition: Dict[str, Any]) -> Dict[str, Any]:
         """Perform live validation of team composition."""
+        key = self._cache_key("validate_composition_live", composition)
+        return self._cache.get_or_compute(key, lambda: self._validate_composition(composition))
+    
+    def _validate_composition(self, composition: Dict[str, Any]) -> Dict[str, Any]:
+        """Run live validation without consulting the cache."""
         validation = {
             "status": "valid",
             "errors": [],
@@ -194,6 +206,8 @@ class RealTimeValidator:
     
     def generate_live_preview(self, composition: Dict[str, Any], team_name: str, team_description: str) -> Optional[str]:
         """Generate live YAML preview of the configuration."""
+        # Not cached: the preview carries its generation timestamp, and a failed
+        # generation must be retried on the next rerun rather than replayed
         try:
             if not composition.get('coordinator') or not composition.get('teams'):
                 return None
@@ -281,6 +295,11 @@ class RealTimeValidator:
     
     def calculate_team_metrics(self, composition: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate team composition metrics."""
+        key = self._cache_key("calculate_team_metrics", composition)
+        return self._cache.get_or_compute(key, lambda: self._calculate_metrics(composition))
+    
+    def _calculate_metrics(self, composition: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate team composition metrics without consulting the cache."""
         metrics = {
             "total_agents": 0,
             "coordinators": 0,
@@ -291,40 +310,39 @@ class RealTimeValidator:
             "team_balance_score": 0.0
         }
         
-        all_capabilities = set()
+        agents = self.agent_library.agents
+        capability_masks = self.agent_library.capability_masks
+        covered_mask = 0
         compatibility_scores = []
         
         # Count coordinator
         coordinator = composition.get('coordinator')
-        if coordinator and coordinator in self.agent_library.agents:
+        if coordinator and coordinator in agents:
             metrics["coordinators"] = 1
             metrics["total_agents"] += 1
-            coordinator_metadata = self.agent_library.agents[coordinator]
-            all_capabilities.update([cap.value for cap in coordinator_metadata.capabilities])
-            compatibility_scores.append(coordinator_metadata.compatibility_score)
+            covered_mask |= capability_masks[coordinator]
+            compatibility_scores.append(agents[coordinator].compatibility_score)
         
         # Count teams and workers
         for team_data in composition.get('teams', {}).values():
             supervisor = team_data.get('supervisor')
-            if supervisor and supervisor in self.agent_library.agents:
+            if supervisor and supervisor in agents:
                 metrics["supervisors"] += 1
                 metrics["total_agents"] += 1
-                supervisor_metadata = self.agent_library.agents[supervisor]
-                all_capabilities.update([cap.value for cap in supervisor_metadata.capabilities])
-                compatibility_scores.append(supervisor_metadata.compatibility_score)
+                covered_mask |= capability_masks[supervisor]
+                compatibility_scores.append(agents[supervisor].compatibility_score)
             
             for worker_id in team_data.get('workers', []):
-                if worker_id in self.agent_library.agents:
+                if worker_id in agents:
                     metrics["workers"] += 1
                     metrics["total_agents"] += 1
-                    worker_metadata = self.agent_library.agents[worker_id]
-                    all_capabilities.update([cap.value for cap in worker_metadata.capabilities])
-                    compatibility_scores.append(worker_metadata.compatibility_score)
+                    covered_mask |= capability_masks[worker_id]
+                    compatibility_scores.append(agents[worker_id].compatibility_score)
         
-        # Calculate capabilities coverage
-        total_possible_capabilities = len(self.agent_library.get_statistics()['capabilities'])
+        # Calculate capabilities coverage (popcount of the OR of member bitmasks)
+        total_possible_capabilities = self.agent_library.capability_count
         if total_possible_capabilities > 0:
-            metrics["capabilities_coverage"] = len(all_capabilities) / total_possible_capabilities
+            metrics["capabilities_coverage"] = bin(covered_mask).count("1") / total_possible_capabilities
         
         # Calculate average compatibility
         if compatibility_scores:
@@ -7,6 +7,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 import traceback
+from itertools import islice
 
 from .enhanced_agent_library import EnhancedAgentLibrary
 from .agent_role_classifier import AgentRole
@@ -445,7 +446,7 @@ class SimpleTeamBuilder:
                 <h4>👥 {metadata.name}</h4>
                 <p><small>{metadata.description[:100]}{'...' if len(metadata.description) > 100 else ''}</small></p>
                 <div>
-                    {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in list(metadata.capabilities)[:4]])}
+                    {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in islice(metadata.capabilities, 4)])}
                 </div>
                 {'<p><strong>✅ Currently Selected</strong></p>' if is_selected else ''}
             </div>
@@ -474,7 +475,7 @@ class SimpleTeamBuilder:
                 <h4>🤖 {metadata.name}</h4>
                 <p><small>{metadata.description[:100]}{'...' if len(metadata.description) > 100 else ''}</small></p>
                 <div>
-                    {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in list(metadata.capabilities)[:4]])}
+                    {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in islice(metadata.capabilities, 4)])}
                 </div>
                 {'<p><strong>✅ Selected</strong></p>' if is_selected else ''}
             </div>
@@ -543,7 +544,7 @@ class SimpleTeamBuilder:
                         <h5>🤖 {worker_metadata.name}</h5>
                         <p><small>{worker_metadata.description[:80]}...</small></p>
                         <div>
-                            {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in list(worker_metadata.capabilities)[:3]])}
+                            {' '.join([f'<span class="capability-tag">{cap.value}</span>' for cap in islice(worker_metadata.capabilities, 3)])}
                         </div>
                     </div>
                     """, unsafe_allow_html=True)
@@ -4,6 +4,7 @@ Interactive Team Composition Interface with Drag-and-Drop functionality
 import streamlit as st
 from typing import Dict, Any, List, Optional, Set
 import json
+import sys
 from datetime import datetime
 
 from .enhanced_agent_library import EnhancedAgentLibrary
@@ -276,7 +277,7 @@ class TeamCompositionInterface:
                 )
                 
                 if selected_coordinator != "Select a coordinator...":
-                    agent_id = selected_coordinator.split(" (")[-1].rstrip(")")
+                    agent_id = sys.intern(selected_coordinator.split(" (")[-1].rstrip(")"))
                     if st.button("Add as Coordinator", key="quick_add_coordinator"):
                         self._add_as_coordinator(agent_id)
                         st.rerun()
@@ -356,7 +357,7 @@ class TeamCompositionInterface:
                 )
                 
                 if selected_supervisor != "Select supervisor...":
-                    agent_id = selected_supervisor.split(" (")[-1].rstrip(")")
+                    agent_id = sys.intern(selected_supervisor.split(" (")[-1].rstrip(")"))
                     if st.button("Add Supervisor", key=f"add_supervisor_{team_id}"):
                         team_data['supervisor'] = agent_id
                         st.rerun()
@@ -404,7 +405,7 @@ class TeamCompositionInterface:
                 )
                 
                 if selected_worker != "Select worker...":
-                    agent_id = selected_worker.split(" (")[-1].rstrip(")")
+                    agent_id = sys.intern(selected_worker.split(" (")[-1].rstrip(")"))
                     if st.button("Add Worker", key=f"add_worker_{team_id}"):
                         workers.append(agent_id)
                         team_data['workers'] = workers
@@ -606,7 +607,7 @@ class TeamCompositionInterface:
     
     def _add_as_supervisor(self, agent_id: str):
         """Add agent as supervisor to a new team."""
-        team_id = str(st.session_state.team_composition['next_team_id'])
+        team_id = sys.intern(str(st.session_state.team_composition['next_team_id']))
         st.session_state.team_composition['teams'][team_id] = {
             'name': f'Team {team_id}',
             'description': '',
@@ -618,7 +619,7 @@ class TeamCompositionInterface:
     
     def _add_new_team(self):
         """Add a new empty team."""
-        team_id = str(st.session_state.team_composition['next_team_id'])
+        team_id = sys.intern(str(st.session_state.team_composition['next_team_id']))
         st.session_state.team_composition['teams'][team_id] = {
             'name': f'Team {team_id}',
             'description': '',
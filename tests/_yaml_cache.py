@@ -0,0 +1,71 @@
+"""
+Parse-once YAML loading for tests and validation scripts.
+
+Parsed files are memoized in-process and mirrored to a JSON file under a
+sibling ``.cache`` directory, which later runs read instead of re-parsing
+the YAML while its recorded mtime and size still match. Set NO_YAML_CACHE=1 to bypass the JSON cache.
+"""
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _json_cache_path(path: Path) -> Path:
+    # Full name, so foo.yml and foo.yaml in one directory get separate mirrors
+    return path.parent / ".cache" / f"{path.name}.json"
+
+
+def _write_json_cache(cache_path: Path, mtime_ns: int, size: int, data: Any):
+    """Atomically write the JSON mirror, skipping data JSON cannot round-trip."""
+    try:
+        text = json.dumps({"mtime_ns": mtime_ns, "size": size, "data": data})
+    except (TypeError, ValueError):
+        return
+    if json.loads(text)["data"] != data:
+        # e.g. non-string keys or tuples would come back changed
+        return
+    
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=128)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Any:
+    source = Path(path)
+    if os.environ.get("NO_YAML_CACHE"):
+        return yaml.load(source.read_bytes(), Loader=YamlLoader)
+    
+    cache_path = _json_cache_path(source)
+    try:
+        mirror = json.loads(cache_path.read_bytes())
+        # An exact match, so a source replaced by an older copy isn't served stale data
+        if (mirror["mtime_ns"], mirror["size"]) == (mtime_ns, size):
+            return mirror["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    
+    data = yaml.load(source.read_bytes(), Loader=YamlLoader)
+    _write_json_cache(cache_path, mtime_ns, size, data)
+    return data
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Any:
+    """Parse a YAML file, reusing the result until its mtime or size changes.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    stat = os.stat(path)
+    return _load_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
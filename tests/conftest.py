@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests._yaml_cache import load_yaml_cached
+
+
+@pytest.fixture(scope="session")
+def agent_library(tmp_path_factory):
+    """Agent library scanned once per test session."""
+    from src.ui.enhanced_agent_library import EnhancedAgentLibrary
+    cache_file = tmp_path_factory.mktemp("classification") / "classify.json"
+    return EnhancedAgentLibrary(classification_cache=str(cache_file))
+
+
+@pytest.fixture(scope="session")
+def config_loader():
+    """Configuration loader shared across the test session."""
+    from src.core.config_loader import ConfigLoader
+    return ConfigLoader()
+
+
+@pytest.fixture(scope="session")
+def example_config_path():
+    """Path of the first example agent configuration."""
+    config_files = sorted(Path("configs/examples").glob("*.yml"))
+    if not config_files:
+        pytest.skip("No configs/examples directory found")
+    return config_files[0]
+
+
+@pytest.fixture(scope="session")
+def example_config(example_config_path):
+    """Parsed contents of the first example agent configuration."""
+    return load_yaml_cached(example_config_path)
@@ -0,0 +1,91 @@
+"""
+Tests for the persistent agent classification cache.
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.ui.agent_role_classifier import AgentRoleClassifier
+
+
+EXAMPLE_CONFIGS = sorted(Path("configs/examples").glob("*.yml"))
+
+
+@pytest.fixture
+def configs_dir(tmp_path):
+    """Directory holding copies of the example agent configurations."""
+    if not EXAMPLE_CONFIGS:
+        pytest.skip("No configs/examples directory found")
+    directory = tmp_path / "configs"
+    directory.mkdir()
+    # Several copies of each example so the directory scan spreads across worker threads
+    for copy_index in range(5):
+        for config_file in EXAMPLE_CONFIGS:
+            shutil.copy(config_file, directory / f"{config_file.stem}_{copy_index}.yml")
+    return directory
+
+
+def _count_classifications(classifier, monkeypatch):
+    """Count calls that classify a file from scratch instead of using the cache."""
+    calls = []
+    classify = classifier._classify
+
+    def counting_classify(config_path):
+        calls.append(config_path)
+        return classify(config_path)
+
+    monkeypatch.setattr(classifier, "_classify", counting_classify)
+    return calls
+
+
+class TestClassificationCache:
+    """Test cases for AgentRoleClassifier's classification cache."""
+
+    def test_results_persist_across_instances(self, configs_dir, tmp_path, monkeypatch):
+        """Test that a new classifier reuses saved results without reclassifying."""
+        config_file = str(next(configs_dir.glob("*.yml")))
+        cache_file = tmp_path / "classify.json"
+
+        classifier = AgentRoleClassifier(cache_path=str(cache_file))
+        metadata = classifier.classify_agent(config_file)
+        classifier.save_cache()
+        assert cache_file.exists()
+
+        warm_classifier = AgentRoleClassifier(cache_path=str(cache_file))
+        calls = _count_classifications(warm_classifier, monkeypatch)
+        assert warm_classifier.classify_agent(config_file) == metadata
+        assert calls == []
+
+    def test_edited_file_is_reclassified_and_replaced(self, configs_dir, tmp_path, monkeypatch):
+        """Test that an edited file is classified again and keeps a single cache entry."""
+        config_file = next(configs_dir.glob("*.yml"))
+        cache_file = tmp_path / "classify.json"
+
+        classifier = AgentRoleClassifier(cache_path=str(cache_file))
+        calls = _count_classifications(classifier, monkeypatch)
+        classifier.classify_agent(str(config_file))
+
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        classifier.classify_agent(str(config_file))
+        classifier.save_cache()
+
+        assert len(calls) == 2
+        with open(cache_file) as f:
+            assert list(json.load(f)["entries"]) == [os.path.abspath(config_file)]
+
+    def test_concurrent_directory_classification(self, configs_dir, tmp_path, monkeypatch):
+        """Test that a threaded directory scan caches every file and saves without an explicit call."""
+        cache_file = tmp_path / "classify.json"
+
+        agents = AgentRoleClassifier(cache_path=str(cache_file)).classify_agents_from_directory(str(configs_dir))
+        assert len(agents) == len(list(configs_dir.glob("*.yml")))
+        assert cache_file.exists()
+
+        warm_classifier = AgentRoleClassifier(cache_path=str(cache_file))
+        calls = _count_classifications(warm_classifier, monkeypatch)
+        assert warm_classifier.classify_agents_from_directory(str(configs_dir)) == agents
+        assert calls == []
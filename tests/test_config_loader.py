@@ -60,10 +60,10 @@ def config_file(sample_config):
 class TestConfigLoader:
     """Test cases for ConfigLoader."""
     
-    def test_load_valid_config(self, config_file, sample_config):
+    def test_load_valid_config(self, config_file, sample_config, monkeypatch):
         """Test loading a valid configuration."""
         # Set required environment variable
-        os.environ["TEST_API_KEY"] = "test_key"
+        monkeypatch.setenv("TEST_API_KEY", "test_key")
         
         loader = ConfigLoader()
         config = loader.load_config(config_file)
@@ -75,7 +75,6 @@ class TestConfigLoader:
         
         # Clean up
         os.unlink(config_file)
-        del os.environ["TEST_API_KEY"]
     
     def test_load_nonexistent_file(self):
         """Test loading a non-existent configuration file."""
@@ -96,22 +95,21 @@ class TestConfigLoader:
             
             os.unlink(f.name)
     
-    def test_missing_api_key_env(self, config_file):
+    def test_missing_api_key_env(self, config_file, monkeypatch):
         """Test validation when API key environment variable is missing."""
         loader = ConfigLoader()
         
         # Ensure the test API key is not set
-        if "TEST_API_KEY" in os.environ:
-            del os.environ["TEST_API_KEY"]
+        monkeypatch.delenv("TEST_API_KEY", raising=False)
         
         with pytest.raises(ValueError, match="Environment variable TEST_API_KEY not found"):
             loader.load_config(config_file)
         
         os.unlink(config_file)
     
-    def test_get_prompt_template(self, config_file):
+    def test_get_prompt_template(self, config_file, monkeypatch):
         """Test getting formatted prompt templates."""
-        os.environ["TEST_API_KEY"] = "test_key"
+        monkeypatch.setenv("TEST_API_KEY", "test_key")
         
         loader = ConfigLoader()
         config = loader.load_config(config_file)
@@ -128,11 +126,10 @@ class TestConfigLoader:
         
         # Clean up
         os.unlink(config_file)
-        del os.environ["TEST_API_KEY"]
     
-    def test_validate_config(self, sample_config):
+    def test_validate_config(self, sample_config, monkeypatch):
         """Test configuration validation."""
-        os.environ["TEST_API_KEY"] = "test_key"
+        monkeypatch.setenv("TEST_API_KEY", "test_key")
         
         loader = ConfigLoader()
         
@@ -143,12 +140,10 @@ class TestConfigLoader:
         invalid_config = sample_config.copy()
         del invalid_config["agent"]
         assert loader.validate_config(invalid_config) is False
-        
-        del os.environ["TEST_API_KEY"]
     
-    def test_config_with_memory(self, sample_config):
+    def test_config_with_memory(self, sample_config, monkeypatch):
         """Test configuration with memory settings."""
-        os.environ["TEST_API_KEY"] = "test_key"
+        monkeypatch.setenv("TEST_API_KEY", "test_key")
         
         # Add memory configuration
         sample_config["memory"] = {
@@ -183,12 +178,10 @@ class TestConfigLoader:
             assert config.memory.settings.max_memory_size == 5000
             
             os.unlink(f.name)
-        
-        del os.environ["TEST_API_KEY"]
     
-    def test_config_with_tools(self, sample_config):
+    def test_config_with_tools(self, sample_config, monkeypatch):
         """Test configuration with tools."""
-        os.environ["TEST_API_KEY"] = "test_key"
+        monkeypatch.setenv("TEST_API_KEY", "test_key")
         
         # Add tools configuration
         sample_config["tools"] = {
@@ -217,8 +210,6 @@ class TestConfigLoader:
             assert config.tools.custom[0].name == "custom_tool"
             
             os.unlink(f.name)
-        
-        del os.environ["TEST_API_KEY"]
 
 
 if __name__ == "__main__":
@@ -4,6 +4,10 @@ Test script for the Dynamic Template Builder functionality
 """
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
@@ -95,9 +99,9 @@ def test_template_generation():
             return True
         
         # Create a simple team configuration
-        coordinator_id = list(coordinators.keys())[0]
-        supervisor_id = list(supervisors.keys())[0]
-        worker_ids = list(workers.keys())[:2]  # Get first 2 workers
+        coordinator_id = next(iter(coordinators))
+        supervisor_id = next(iter(supervisors))
+        worker_ids = list(islice(workers, 2))  # Get first 2 workers
         
         teams_data = [{
             'name': 'Test Team',
@@ -190,9 +194,9 @@ def test_validation():
         workers = library.get_workers()
         
         if coordinators and supervisors and workers:
-            coordinator_id = list(coordinators.keys())[0]
-            supervisor_id = list(supervisors.keys())[0]
-            worker_ids = list(workers.keys())[:2]
+            coordinator_id = next(iter(coordinators))
+            supervisor_id = next(iter(supervisors))
+            worker_ids = list(islice(workers, 2))
             
             basic_composition = {
                 'coordinator': coordinator_id,
@@ -226,6 +230,34 @@ def test_validation():
         return False
 
 
+class _PerThreadStdout(io.TextIOBase):
+    """Route writes from each runner thread into that thread's own buffer."""
+    
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+    
+    def capture(self) -> io.StringIO:
+        self._local.buffer = io.StringIO()
+        return self._local.buffer
+    
+    def write(self, text):
+        return getattr(self._local, "buffer", self._fallback).write(text)
+    
+    def flush(self):
+        self._fallback.flush()
+
+
+def _run_captured(stdout: _PerThreadStdout, test):
+    """Run a test function, returning its result and captured output."""
+    buffer = stdout.capture()
+    try:
+        return test(), buffer.getvalue()
+    except Exception as e:
+        print(f"  ❌ {test.__name__} raised: {e}")
+        return False, buffer.getvalue()
+
+
 def main():
     """Run all tests."""
     print("🚀 Starting Dynamic Template Builder Tests\n")
@@ -241,10 +273,21 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test in tests:
-        if test():
+    # Tests are independent and mostly I/O bound; run them concurrently and
+    # print each one's output as a block, in the order listed above
+    stdout = _PerThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(_run_captured, stdout, test) for test in tests]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout._fallback
+    
+    for success, output in results:
+        print(output)  # Add spacing between tests
+        if success:
             passed += 1
-        print()  # Add spacing between tests
     
     print(f"📊 Test Results: {passed}/{total} tests passed")
     
@@ -2,6 +2,7 @@
 Tests for memory manager functionality.
 """
 import pytest
+import time
 from datetime import datetime, timedelta
 from langchain_core.messages import HumanMessage, AIMessage
 
@@ -64,11 +65,16 @@ class TestMemoryManager:
         
         # Store interaction should do nothing
         manager.store_interaction(messages, response)
-        assert len(manager.episodic_memory) == 0
+        assert not manager.episodic_memory
         
         # Retrieve memory should return empty
         memory = manager.retrieve_memory("test query")
         assert memory == {}
+        assert manager.get_relevant_context("test query") == ""
+        
+        # Manual storage should also be skipped
+        manager.store_memory(HumanMessage(content="Ignored"))
+        assert not manager.memory_store
     
     def test_store_and_retrieve_episodic_memory(self, memory_config):
         """Test storing and retrieving episodic memory."""
@@ -97,7 +103,7 @@ class TestMemoryManager:
         manager.store_interaction(messages, response)
         
         # Check semantic memory was updated
-        assert len(manager.semantic_memory) > 0
+        assert manager.semantic_memory
     
     def test_procedural_memory_update(self, memory_config):
         """Test procedural memory updates."""
@@ -110,13 +116,13 @@ class TestMemoryManager:
         manager.store_interaction(messages, response)
         
         # Check procedural memory was updated
-        assert len(manager.procedural_memory) > 0
+        assert manager.procedural_memory
         
         # Store another successful interaction with same pattern
         manager.store_interaction(messages, response)
         
         # Success count should increase
-        pattern_id = list(manager.procedural_memory.keys())[0]
+        pattern_id = next(iter(manager.procedural_memory))
         assert manager.procedural_memory[pattern_id]["success_count"] >= 1
     
     def test_search_semantic_memory(self, memory_config):
@@ -127,17 +133,17 @@ class TestMemoryManager:
         manager.semantic_memory["fact1"] = {
             "fact": "Python is a programming language",
             "confidence": 0.9,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
         manager.semantic_memory["fact2"] = {
             "fact": "Java is also a programming language",
             "confidence": 0.8,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
         
         # Search for relevant facts
         results = manager._search_semantic_memory("Python programming")
-        assert len(results) > 0
+        assert results
         assert any("Python" in result for result in results)
     
     def test_search_episodic_memory(self, memory_config):
@@ -155,7 +161,7 @@ class TestMemoryManager:
         
         # Search episodes
         results = manager._search_episodic_memory("Python programming")
-        assert len(results) > 0
+        assert results
     
     def test_get_relevant_context(self, memory_config):
         """Test getting relevant context."""
@@ -188,6 +194,30 @@ class TestMemoryManager:
         # Should be cleaned up to max size
         assert len(manager.episodic_memory) <= memory_config.settings.max_memory_size
     
+    def test_token_cache_bounded_by_cleanup(self, memory_config):
+        """Test that token ids for trimmed episodes don't accumulate."""
+        memory_config.settings.max_memory_size = 2
+        manager = MemoryManager(memory_config)
+        
+        for i in range(20):
+            manager.store_interaction([HumanMessage(content=f"Message {i}")], AIMessage(content=f"Response {i}"))
+            manager._search_episodic_memory("message")
+        
+        live_texts = len(manager.episodic_memory) + len(manager.semantic_memory)
+        assert len(manager._token_ids) <= 2 * live_texts + 1
+    
+    def test_retention_cleanup(self, memory_config):
+        """Test that episodes older than the retention period are dropped."""
+        manager = MemoryManager(memory_config)
+        
+        manager.store_interaction([HumanMessage(content="Old message")], AIMessage(content="Old response"))
+        manager.episodic_memory[0]["timestamp"] = time.time() - timedelta(days=30).total_seconds()
+        
+        manager.store_interaction([HumanMessage(content="New message")], AIMessage(content="New response"))
+        
+        assert len(manager.episodic_memory) == 1
+        assert manager.episodic_memory[0]["messages"][0]["content"] == "New message"
+    
     def test_memory_stats(self, memory_config):
         """Test getting memory statistics."""
         manager = MemoryManager(memory_config)
@@ -215,16 +245,16 @@ class TestMemoryManager:
         manager.store_interaction(messages, response)
         
         # Verify data exists
-        assert len(manager.episodic_memory) > 0 or len(manager.semantic_memory) > 0
+        assert manager.episodic_memory or manager.semantic_memory
         
         # Clear memory
         manager.clear_memory()
         
         # Verify all memory is cleared
-        assert len(manager.episodic_memory) == 0
-        assert len(manager.semantic_memory) == 0
-        assert len(manager.procedural_memory) == 0
-        assert len(manager.memory_store) == 0
+        assert not manager.episodic_memory
+        assert not manager.semantic_memory
+        assert not manager.procedural_memory
+        assert not manager.memory_store
     
     def test_export_import_history(self, memory_config):
         """Test exporting and importing memory history."""
@@ -248,6 +278,26 @@ class TestMemoryManager:
         # Verify data was restored
         stats_after = manager.get_stats()
         assert stats_after["episodic_interactions"] > 0
+        
+        # Timestamps are exported as ISO strings and restored as epoch seconds
+        assert isinstance(manager.episodic_memory[0]["timestamp"], float)
+    
+    def test_export_import_history_msgpack(self, memory_config):
+        """Test exporting and importing memory history via msgpack."""
+        pytest.importorskip("msgpack")
+        manager = MemoryManager(memory_config)
+        
+        messages = [HumanMessage(content="Test message")]
+        response = AIMessage(content="Test response")
+        manager.store_interaction(messages, response)
+        
+        payload = manager.export_history_msgpack()
+        assert isinstance(payload, bytes)
+        
+        manager.clear_memory()
+        manager.import_history_msgpack(payload)
+        
+        assert manager.get_stats()["episodic_interactions"] > 0
     
     def test_store_individual_memory(self, memory_config):
         """Test storing individual memory items."""
@@ -256,7 +306,7 @@ class TestMemoryManager:
         content = HumanMessage(content="Important information to remember")
         manager.store_memory(content)
         
-        assert len(manager.memory_store) > 0
+        assert manager.memory_store
 
 
 if __name__ == "__main__":
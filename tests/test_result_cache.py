@@ -0,0 +1,102 @@
+"""
+Tests for result caching in live validation.
+"""
+import pytest
+
+from src.config.result_cache import ResultCache, content_key
+from src.config.dynamic_template_generator import DynamicTemplateGenerator
+from src.ui.real_time_validator import RealTimeValidator
+
+
+@pytest.fixture
+def validator(agent_library):
+    """Live validator over the shared agent library."""
+    return RealTimeValidator(agent_library, DynamicTemplateGenerator(agent_library))
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_computes_once_per_key(self):
+        """Test that a repeated key is served without recomputing."""
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return {"errors": []}
+
+        first = cache.get_or_compute(content_key({"a": 1, "b": 2}), compute)
+        assert cache.get_or_compute(content_key({"b": 2, "a": 1}), compute) == first
+        assert len(calls) == 1
+
+    def test_returns_copies(self):
+        """Test that mutating a returned result leaves the cached result intact."""
+        cache = ResultCache()
+        key = content_key("key")
+
+        first = cache.get_or_compute(key, lambda: {"errors": []})
+        first["errors"].append("changed by caller")
+        assert cache.get_or_compute(key, lambda: {"errors": ["recomputed"]}) == {"errors": []}
+
+    def test_failed_compute_is_not_cached(self):
+        """Test that an exception from compute leaves nothing behind for the key."""
+        cache = ResultCache()
+        key = content_key("key")
+
+        def fail():
+            raise RuntimeError("transient failure")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute(key, fail)
+        assert cache.get_or_compute(key, lambda: "ok") == "ok"
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is dropped once the cache is full."""
+        cache = ResultCache(max_entries=2)
+        for name in ("a", "b"):
+            cache.get_or_compute(content_key(name), lambda: name)
+        cache.get_or_compute(content_key("a"), lambda: "recomputed")
+        cache.get_or_compute(content_key("c"), lambda: "c")
+
+        assert cache.get_or_compute(content_key("a"), lambda: "recomputed") == "a"
+        assert cache.get_or_compute(content_key("b"), lambda: "recomputed") == "recomputed"
+
+
+class TestLiveValidationCache:
+    """Test cases for RealTimeValidator's composition-hash cache."""
+
+    def test_validation_served_from_cache(self, validator, monkeypatch):
+        """Test that equal compositions are validated once and callers get their own copy."""
+        calls = []
+        validate = validator._validate_composition
+
+        def counting_validate(composition):
+            calls.append(composition)
+            return validate(composition)
+
+        monkeypatch.setattr(validator, "_validate_composition", counting_validate)
+
+        first = validator.validate_composition_live({'coordinator': None, 'teams': {}})
+        first["errors"].append("changed by caller")
+        second = validator.validate_composition_live({'teams': {}, 'coordinator': None})
+
+        assert len(calls) == 1
+        assert "changed by caller" not in second["errors"]
+
+    def test_library_reload_invalidates(self, validator, agent_library, monkeypatch):
+        """Test that reloading the agent library forces revalidation."""
+        calls = []
+        validate = validator._validate_composition
+
+        def counting_validate(composition):
+            calls.append(composition)
+            return validate(composition)
+
+        monkeypatch.setattr(validator, "_validate_composition", counting_validate)
+        composition = {'coordinator': None, 'teams': {}}
+
+        first = validator.validate_composition_live(composition)
+        agent_library.reload_agents()
+        assert validator.validate_composition_live(composition) == first
+        assert len(calls) == 2
@@ -1,216 +1,106 @@
-#!/usr/bin/env python3
 """
-Test script for Simple Team Builder functionality
+Tests for Simple Team Builder functionality
 """
+import importlib
 import sys
-import os
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-def test_agent_library():
+
+def _check_agent_library(component_cls, request, monkeypatch):
     """Test the enhanced agent library."""
-    print("🧪 Testing Enhanced Agent Library...")
-    
-    try:
-        from src.ui.enhanced_agent_library import EnhancedAgentLibrary
-        
-        # Initialize agent library
-        library = EnhancedAgentLibrary()
-        
-        # Get all agents
-        agents = library.get_all_agents()
-        print(f"✅ Found {len(agents)} agents")
-        
-        if agents:
-            print("📋 Available agents:")
-            for agent_id, metadata in agents.items():
-                print(f"  - {agent_id}: {metadata.name}")
-        
-        # Test statistics
-        stats = library.get_statistics()
-        print(f"📊 Library statistics: {stats}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing agent library: {e}")
-        return False
-
-def test_simple_template_generator():
+    agent_library = request.getfixturevalue("agent_library")
+    assert isinstance(agent_library, component_cls)
+
+    agents = agent_library.get_all_agents()
+    assert agents
+
+    stats = agent_library.get_statistics()
+    assert stats["total_agents"] == len(agents)
+
+
+def _check_simple_template_generator(component_cls, request, monkeypatch):
     """Test the simple template generator."""
-    print("🧪 Testing Simple Template Generator...")
-    
-    try:
-        from src.config.simple_template_generator import SimpleTemplateGenerator
-        from src.ui.enhanced_agent_library import EnhancedAgentLibrary
-        
-        # Initialize components
-        library = EnhancedAgentLibrary()
-        generator = SimpleTemplateGenerator(library)
-        
-        # Test with sample data
-        team_name = "Test Team"
-        team_description = "A test hierarchical team"
-        supervisor_id = list(library.get_all_agents().keys())[0] if library.get_all_agents() else "test_supervisor"
-        worker_ids = list(library.get_all_agents().keys())[:2] if len(library.get_all_agents()) >= 2 else ["test_worker"]
-        
-        # Generate configuration
-        yaml_content = generator.generate_simple_hierarchical_config(
-            team_name=team_name,
-            team_description=team_description,
-            supervisor_id=supervisor_id,
-            worker_ids=worker_ids
-        )
-        
-        print(f"✅ Generated configuration for {team_name}")
-        print(f"📄 YAML length: {len(yaml_content)} characters")
-        
-        # Test validation
-        validation = generator.validate_simple_config(supervisor_id, worker_ids)
-        print(f"✅ Validation result: {validation['valid']}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing template generator: {e}")
-        return False
-
-def test_simple_team_builder():
+    agent_library = request.getfixturevalue("agent_library")
+    generator = component_cls(agent_library)
+
+    # Materialize the agent IDs once and derive both roles from them
+    agent_ids = list(agent_library.get_all_agents())
+    supervisor_id = agent_ids[0] if agent_ids else "test_supervisor"
+    worker_ids = agent_ids[:2] if len(agent_ids) >= 2 else ["test_worker"]
+
+    yaml_content = generator.generate_simple_hierarchical_config(
+        team_name="Test Team",
+        team_description="A test hierarchical team",
+        supervisor_id=supervisor_id,
+        worker_ids=worker_ids
+    )
+    assert yaml_content
+
+    validation = generator.validate_simple_config(supervisor_id, worker_ids)
+    assert "valid" in validation
+
+
+def _check_simple_team_builder(component_cls, request, monkeypatch):
     """Test the simple team builder."""
-    print("🧪 Testing Simple Team Builder...")
-    
-    try:
-        from src.ui.simple_team_builder import SimpleTeamBuilder
-        from src.ui.enhanced_agent_library import EnhancedAgentLibrary
-        
-        # Initialize components
-        library = EnhancedAgentLibrary()
-        builder = SimpleTeamBuilder(library)
-        
-        print("✅ Simple Team Builder initialized successfully")
-        
-        # Test team validation
-        test_team = {
-            'supervisor': 'test_supervisor',
-            'workers': ['test_worker1', 'test_worker2'],
-            'team_name': 'Test Team',
-            'team_description': 'A test team'
-        }
-        
-        is_valid = builder._validate_team()
-        print(f"✅ Team validation: {is_valid}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing team builder: {e}")
-        return False
-
-def test_hierarchical_components():
+    builder = component_cls(request.getfixturevalue("agent_library"))
+
+    # No supervisor or workers have been selected yet
+    assert not builder._validate_team()
+
+
+def _check_hierarchical_components(component_cls, request, monkeypatch):
     """Test hierarchical agent components."""
-    print("🧪 Testing Hierarchical Components...")
-    
-    try:
-        from src.hierarchical.hierarchical_agent import HierarchicalAgentTeam
-        from src.hierarchical.supervisor import SupervisorAgent
-        from src.hierarchical.worker_agent import WorkerAgent
-        
-        print("✅ Hierarchical components imported successfully")
-        
-        # Test basic initialization
-        team = HierarchicalAgentTeam(name="test_team")
-        print(f"✅ Hierarchical team created: {team}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing hierarchical components: {e}")
-        return False
-
-def test_config_loader():
+    # The coordinator LLM client requires a key at construction time
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+
+    team = component_cls(name="test_team")
+    assert team.name == "test_team"
+
+
+def _check_config_loader(component_cls, request, monkeypatch):
     """Test configuration loading."""
-    print("🧪 Testing Configuration Loader...")
-    
-    try:
-        from src.core.config_loader import ConfigLoader
-        
-        loader = ConfigLoader()
-        print("✅ Config loader initialized successfully")
-        
-        # Check if example configs exist
-        configs_dir = Path("configs/examples")
-        if configs_dir.exists():
-            config_files = list(configs_dir.glob("*.yml"))
-            print(f"✅ Found {len(config_files)} configuration files")
-            
-            if config_files:
-                # Try to load the first config
-                first_config = config_files[0]
-                print(f"📄 Testing config: {first_config.name}")
-                
-                try:
-                    config = loader.load_config(str(first_config))
-                    print(f"✅ Successfully loaded {first_config.name}")
-                except Exception as e:
-                    print(f"⚠️ Could not load {first_config.name}: {e}")
-        else:
-            print("⚠️ No configs/examples directory found")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing config loader: {e}")
-        return False
-
-def main():
-    """Run all tests."""
-    print("🚀 Starting Simple Team Builder Tests...")
-    print("=" * 50)
-    
-    tests = [
-        ("Configuration Loader", test_config_loader),
-        ("Agent Library", test_agent_library),
-        ("Template Generator", test_simple_template_generator),
-        ("Team Builder", test_simple_team_builder),
-        ("Hierarchical Components", test_hierarchical_components),
-    ]
-    
-    results = []
-    
-    for test_name, test_func in tests:
-        print(f"\n🔍 Running {test_name} test...")
-        try:
-            success = test_func()
-            results.append((test_name, success))
-            status = "✅ PASSED" if success else "❌ FAILED"
-            print(f"{status} {test_name}")
-        except Exception as e:
-            print(f"❌ FAILED {test_name}: {e}")
-            results.append((test_name, False))
-    
-    # Summary
-    print("\n" + "=" * 50)
-    print("📊 Test Results Summary:")
-    
-    passed = sum(1 for _, success in results if success)
-    total = len(results)
-    
-    for test_name, success in results:
-        status = "✅ PASSED" if success else "❌ FAILED"
-        print(f"  {status}: {test_name}")
-    
-    print(f"\n🎯 Overall: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! Simple Team Builder should work correctly.")
-        return 0
-    else:
-        print("⚠️ Some tests failed. Check the errors above.")
-        return 1
-
-if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    config_loader = request.getfixturevalue("config_loader")
+    assert isinstance(config_loader, component_cls)
+
+    example_config_path = request.getfixturevalue("example_config_path")
+    example_config = request.getfixturevalue("example_config")
+
+    api_key_env = example_config["llm"].get("api_key_env")
+    if api_key_env:
+        monkeypatch.setenv(api_key_env, "test_key")
+
+    config = config_loader.load_config(str(example_config_path))
+    assert config.agent.name == example_config["agent"]["name"]
+
+
+# (component, module, class) triples; each becomes a separately scheduled test
+COMPONENTS = [
+    ("agent_library", "src.ui.enhanced_agent_library", "EnhancedAgentLibrary"),
+    ("simple_template_generator", "src.config.simple_template_generator", "SimpleTemplateGenerator"),
+    ("simple_team_builder", "src.ui.simple_team_builder", "SimpleTeamBuilder"),
+    ("hierarchical_components", "src.hierarchical.hierarchical_agent", "HierarchicalAgentTeam"),
+    ("config_loader", "src.core.config_loader", "ConfigLoader"),
+]
+
+CHECKS = {
+    "agent_library": _check_agent_library,
+    "simple_template_generator": _check_simple_template_generator,
+    "simple_team_builder": _check_simple_team_builder,
+    "hierarchical_components": _check_hierarchical_components,
+    "config_loader": _check_config_loader,
+}
+
+
+@pytest.mark.parametrize(
+    "component, module, class_name", COMPONENTS, ids=[component for component, _, _ in COMPONENTS]
+)
+def test_component(component, module, class_name, request, monkeypatch):
+    """Import a builder component and run its checks against the shared fixtures."""
+    component_cls = getattr(importlib.import_module(module), class_name)
+    CHECKS[component](component_cls, request, monkeypatch)
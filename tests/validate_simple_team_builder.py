@@ -1,15 +1,31 @@
 #!/usr/bin/env python3
 """
 Quick validation script for Simple Team Builder
+
+Pass --deep to also import hierarchical_web_ui instead of only locating it, and
+--execute-imports to import the project modules rather than only finding them.
 """
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+def module_available(module: str) -> bool:
+    """Check whether a module is installed without executing its body."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        # Ambiguous cases (e.g. namespace packages without a spec) fall back to importing
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            return False
+
 def validate_dependencies():
     """Validate that all required dependencies are available."""
     print("🔍 Validating dependencies...")
@@ -25,10 +41,9 @@ def validate_dependencies():
     
     missing_modules = []
     for module in required_modules:
-        try:
-            __import__(module)
+        if module_available(module):
             print(f"  ✅ {module}")
-        except ImportError:
+        else:
             print(f"  ❌ {module}")
             missing_modules.append(module)
     
@@ -60,7 +75,7 @@ def validate_configs():
     
     return True
 
-def validate_modules():
+def validate_modules(execute_imports: bool = False):
     """Validate that all required modules can be imported."""
     print("\n🔍 Validating module imports...")
     
@@ -75,6 +90,15 @@ def validate_modules():
     
     missing_modules = []
     for module in required_modules:
+        if not execute_imports:
+            # Locating the module is enough to catch missing files and packages
+            if module_available(module):
+                print(f"  ✅ {module}")
+            else:
+                print(f"  ❌ {module}: not found")
+                missing_modules.append(module)
+            continue
+        
         try:
             __import__(module)
             print(f"  ✅ {module}")
@@ -86,28 +110,37 @@ def validate_modules():
         print(f"\n❌ Missing modules: {', '.join(missing_modules)}")
         return False
     
-    print("✅ All modules can be imported")
+    print("✅ All modules can be imported" if execute_imports else "✅ All modules found")
     return True
 
-def validate_web_ui():
+def validate_web_ui(deep: bool = False):
     """Validate that the web UI can be started."""
     print("\n🔍 Validating web UI...")
     
     try:
-        # Test if we can import the web UI
-        import hierarchical_web_ui
-        print("  ✅ hierarchical_web_ui.py can be imported")
-        
-        # Test if streamlit can run
-        import streamlit as st
+        if not module_available("streamlit"):
+            print("  ❌ Streamlit is not installed")
+            return False
         print("  ✅ Streamlit is available")
         
+        if deep and "hierarchical_web_ui" in sys.modules:
+            print("  ✅ hierarchical_web_ui.py already imported")
+        elif deep:
+            # Importing the UI module pulls in the full agent stack
+            import hierarchical_web_ui
+            print("  ✅ hierarchical_web_ui.py can be imported")
+        elif (project_root / "hierarchical_web_ui.py").exists():
+            print("  ✅ hierarchical_web_ui.py found (use --deep to import it)")
+        else:
+            print("  ❌ hierarchical_web_ui.py not found")
+            return False
+        
         return True
     except Exception as e:
         print(f"  ❌ Web UI validation failed: {e}")
         return False
 
-def main():
+def main(deep: bool = False, execute_imports: bool = False):
     """Main validation function."""
     print("🚀 Simple Team Builder Validation")
     print("=" * 50)
@@ -115,8 +148,8 @@ def main():
     checks = [
         ("Dependencies", validate_dependencies),
         ("Configurations", validate_configs),
-        ("Modules", validate_modules),
-        ("Web UI", validate_web_ui)
+        ("Modules", lambda: validate_modules(execute_imports)),
+        ("Web UI", lambda: validate_web_ui(deep))
     ]
     
     results = []
@@ -156,5 +189,6 @@ def main():
     return passed == len(results)
 
 if __name__ == "__main__":
-    success = main()
+    args = sys.argv[1:]
+    success = main(deep="--deep" in args, execute_imports="--execute-imports" in args)
     sys.exit(0 if success else 1) 
\ No newline at end of file
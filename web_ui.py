@@ -6,16 +6,72 @@ import yaml
 import os
 import tempfile
 import json
+import hashlib
+import subprocess
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Callable, Final, List, Tuple, Type
 import asyncio
 from datetime import datetime
 import sys
 
-# Import project modules
-from src.core.configurable_agent import ConfigurableAgent
-from src.core.config_loader import ConfigLoader, AgentConfiguration
-from src.tools.tool_registry import ToolRegistry
+# Project modules pull in LangChain/LangGraph and the provider SDKs; they are
+# imported where first needed so a fresh session can render before they load
+if TYPE_CHECKING:
+    from src.core.configurable_agent import ConfigurableAgent
+    from src.core.config_loader import ConfigLoader
+    from src.hierarchical import HierarchicalAgentTeam
+    from src.tools.tool_registry import ToolRegistry
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+    def _json_canonical(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+    def _json_canonical(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+    _json_loads = json.loads
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# Prefer the libyaml C implementations when PyYAML was built with them
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Top-level sections in the order they are written to files; dumping with
+# sort_keys=False keeps this layout and skips PyYAML's Python-side key sort
+CONFIG_SECTIONS = ("agent", "llm", "prompts", "tools", "memory", "react", "optimization", "runtime")
+
+# Fixed form options, with position lookups for selectbox defaults
+MEMORY_PROVIDERS = ("langmem", "custom")
+MEMORY_PROVIDER_INDEX = {provider: i for i, provider in enumerate(MEMORY_PROVIDERS)}
+STORAGE_BACKENDS = ("memory", "postgres", "redis")
+STORAGE_BACKEND_INDEX = {backend: i for i, backend in enumerate(STORAGE_BACKENDS)}
+OPTIMIZATION_FREQUENCIES = ("daily", "weekly", "monthly")
+OPTIMIZATION_FREQUENCY_INDEX = {frequency: i for i, frequency in enumerate(OPTIMIZATION_FREQUENCIES)}
+PERFORMANCE_METRICS = ("response_time", "accuracy", "user_satisfaction", "source_quality", "resolution_rate",
+                       "customer_satisfaction", "escalation_rate", "code_quality", "execution_success")
+PERFORMANCE_METRIC_SET = frozenset(PERFORMANCE_METRICS)
+DEFAULT_PERFORMANCE_METRICS = ("response_time", "accuracy", "user_satisfaction")
 
 # Page configuration
 st.set_page_config(
@@ -25,17 +81,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS to optimize sidebar width (20% of screen) and ensure content is visible
-st.markdown("""
+@st.cache_resource(show_spinner=False)
+def _page_style() -> str:
+    """Custom CSS to optimize sidebar width (20% of screen) and ensure content is visible."""
+    return """
 <style>
-    [data-testid="stSidebar"] {
-        width: 20% !important;
-        min-width: 280px !important;
-    }
-    [data-testid="stSidebar"] > div:first-child {
-        width: 20% !important;
-        min-width: 280px !important;
-    }
+    [data-testid="stSidebar"],
+    [data-testid="stSidebar"] > div:first-child,
     [data-testid="stSidebar"] > div:first-child > div:first-child {
         width: 20% !important;
         min-width: 280px !important;
@@ -51,7 +103,8 @@ st.markdown("""
         padding: 0.2rem 0.5rem !important;
         font-size: 0.8rem !important;
     }
-    [data-testid="stSidebar"] .stMarkdown {
+    [data-testid="stSidebar"] .stMarkdown,
+    [data-testid="stSidebar"] .stExpander {
         margin: 2px 0 !important;
     }
     [data-testid="stSidebar"] .stSubheader {
@@ -62,9 +115,6 @@ st.markdown("""
     [data-testid="stSidebar"] .stSelectbox > div > div {
         font-size: 0.8rem !important;
     }
-    [data-testid="stSidebar"] .stExpander {
-        margin: 2px 0 !important;
-    }
     [data-testid="stSidebar"] .stCaption {
         font-size: 0.75rem !important;
     }
@@ -73,144 +123,26 @@ st.markdown("""
         font-size: 0.8rem !important;
     }
     
-    /* Fix text area text color - ensure text is black and readable */
-    .stTextArea textarea {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Fix text input text color */
-    .stTextInput input {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Fix selectbox text color */
-    .stSelectbox select {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Fix number input text color */
-    .stNumberInput input {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Ensure all form elements have readable text */
+    /* Keep form text black on white so it stays readable. The element
+       selectors also cover widgets nested inside forms and containers. */
     .stTextArea, .stTextInput, .stSelectbox, .stNumberInput {
         color: #000000 !important;
     }
-    
-    /* Fix any white text on white background issues */
-    .stTextArea > div > div > textarea,
-    .stTextInput > div > div > input,
-    .stSelectbox > div > div > select,
-    .stNumberInput > div > div > input {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Additional comprehensive text color fixes for all form elements */
-    .stTextArea textarea,
-    .stTextInput input,
-    .stSelectbox select,
-    .stNumberInput input,
-    .stMultiselect select,
-    .stSlider input {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Target form elements specifically */
-    .stForm .stTextArea textarea,
-    .stForm .stTextInput input,
-    .stForm .stSelectbox select,
-    .stForm .stNumberInput input,
-    .stForm .stMultiselect select {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Target all input elements with more specific selectors */
+    textarea,
+    select,
     input[type="text"],
     input[type="number"],
-    textarea,
-    select {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Force text color for all Streamlit form widgets */
-    [data-testid="stTextInput"] input,
-    [data-testid="stTextArea"] textarea,
-    [data-testid="stSelectbox"] select,
-    [data-testid="stNumberInput"] input,
-    [data-testid="stMultiselect"] select {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Additional targeting for nested elements */
-    .stTextArea > div > div > div > textarea,
-    .stTextInput > div > div > div > input,
-    .stSelectbox > div > div > div > select,
-    .stNumberInput > div > div > div > input {
-        color: #000000 !important;
-        background-color: #ffffff !important;
-    }
-    
-    /* Fix ONLY form inputs that are white on white */
-    .stTextArea textarea,
     .stTextInput input,
-    .stSelectbox select,
     .stNumberInput input,
-    .stMultiselect select {
+    .stSlider input {
         color: #000000 !important;
         background-color: #ffffff !important;
     }
-    
-    /* Don't affect any other text elements */
-    .stMarkdown, .stMarkdown p, .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4, .stMarkdown h5, .stMarkdown h6,
-    .stMarkdown strong, .stMarkdown em, .stMarkdown small, .stMarkdown span, .stMarkdown div {
-        /* Let these keep their natural colors */
-    }
 </style>
+"""
 
-<script>
-function fixTextColors() {
-    // Fix all textarea elements
-    document.querySelectorAll('textarea').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix all input elements
-    document.querySelectorAll('input[type="text"], input[type="number"]').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix all select elements
-    document.querySelectorAll('select').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-    
-    // Fix only form inputs that are white on white
-    document.querySelectorAll('.stTextArea textarea, .stTextInput input, .stSelectbox select, .stNumberInput input, .stMultiselect select').forEach(function(el) {
-        el.style.color = '#000000';
-        el.style.backgroundColor = '#ffffff';
-    });
-}
-
-// Run on page load
-document.addEventListener('DOMContentLoaded', fixTextColors);
-
-// Run periodically to catch dynamically added elements
-setInterval(fixTextColors, 1000);
-</script>
-""", unsafe_allow_html=True)
+# Streamlit drops any element a rerun doesn't re-emit, so the style is sent on every run
+st.markdown(_page_style(), unsafe_allow_html=True)
 
 # Initialize session state
 if 'config_data' not in st.session_state:
@@ -219,9 +151,44 @@ if 'current_config_file' not in st.session_state:
     st.session_state.current_config_file = None
 if 'agent_instance' not in st.session_state:
     st.session_state.agent_instance = None
+if 'agent_config_key' not in st.session_state:
+    st.session_state.agent_config_key = None
+if 'session_timestamp' not in st.session_state:
+    # Fixed per session so default filenames (and the widgets using them) stay stable across reruns
+    st.session_state.session_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
+def _section_reader(section: str) -> Callable[..., Any]:
+    """Return a lookup for nested values in one config section.
+    
+    An empty or missing section (e.g. on first visit) gets a reader that returns
+    the default straight away, so the form skips every nested lookup.
+    """
+    values = st.session_state.config_data.get(section)
+    if not values:
+        return lambda *keys, default=None: default
+    
+    def read(*keys: str, default: Any = None) -> Any:
+        value = values
+        for key in keys:
+            value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                return default
+        return value
+    
+    return read
+
+def _update_section(section: str, values: Dict[str, Any]) -> bool:
+    """Write form values into a config section in one batch, touching only keys whose value changed."""
+    current = st.session_state.config_data.setdefault(section, {})
+    changes = {key: value for key, value in values.items()
+               if key not in current or current[key] != value}
+    if changes:
+        current.update(changes)
+    return bool(changes)
+
+@st.cache_resource(show_spinner=False)
 def get_available_models():
-    """Get available models for each provider."""
+    """Get available models for each provider (shared, read-only)."""
     return {
         "openai": [
             "gpt-4o", "gpt-4o-mini", "gpt-4-turbo", "gpt-4", "gpt-3.5-turbo",
@@ -241,186 +208,337 @@ def get_available_models():
         ]
     }
 
-def get_built_in_tools():
-    """Get list of available built-in tools."""
-    tool_registry = ToolRegistry()
-    return tool_registry.get_built_in_tools()
+@st.cache_resource(show_spinner=False)
+def get_model_indices():
+    """Position lookups for the provider and model selectboxes (shared, read-only)."""
+    models = get_available_models()
+    provider_index = {provider: i for i, provider in enumerate(models)}
+    model_index = {provider: {model: i for i, model in enumerate(names)} for provider, names in models.items()}
+    return list(models), provider_index, model_index
+
+@st.cache_resource(show_spinner=False)
+def get_tool_registry() -> "ToolRegistry":
+    """Shared ToolRegistry used to list built-in tools."""
+    from src.tools.tool_registry import ToolRegistry
+    return ToolRegistry()
 
-def validate_config(config_data: Dict[str, Any]) -> tuple[bool, str]:
-    """Validate configuration data."""
+@st.cache_resource(show_spinner=False)
+def get_built_in_tools() -> tuple:
+    """Get the available built-in tools as one shared immutable tuple."""
+    return tuple(get_tool_registry().get_built_in_tools())
+
+@st.cache_resource(show_spinner=False)
+def get_hierarchical_team_class() -> Type["HierarchicalAgentTeam"]:
+    """HierarchicalAgentTeam, resolved once on first use; raises ImportError if unavailable."""
+    from src.hierarchical import HierarchicalAgentTeam
+    return HierarchicalAgentTeam
+
+@st.cache_resource(show_spinner=False)
+def get_config_loader() -> "ConfigLoader":
+    """Shared ConfigLoader used for form validation."""
+    from src.core.config_loader import ConfigLoader
+    return ConfigLoader()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _validate_cached(config_key: bytes, _config_data: Dict[str, Any]) -> tuple[bool, str]:
+    """Validate a configuration; cached on its content hash, the dict itself is not hashed."""
     try:
-        config_loader = ConfigLoader()
-        if config_loader.validate_config(config_data):
+        if get_config_loader().validate_config(_config_data):
             return True, "Configuration is valid!"
         else:
             return False, "Invalid configuration format"
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
+def _custom_tools_by_name(custom_tools) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Key custom tool definitions by name, accepting the list form used in config files.
+    
+    Tools with an empty or repeated name are renamed rather than dropped; returns
+    the tools along with a description of each rename.
+    """
+    if isinstance(custom_tools, dict):
+        return custom_tools, []
+    
+    tools_by_name: Dict[str, Dict[str, Any]] = {}
+    renames = []
+    for tool in custom_tools or []:
+        name = base_name = tool.get('name') or 'custom_tool'
+        suffix = 2
+        while name in tools_by_name:
+            name = f"{base_name}_{suffix}"
+            suffix += 1
+        if name != tool.get('name'):
+            renames.append(f"'{tool.get('name') or ''}' → '{name}'")
+            tool = {**tool, 'name': name}
+        tools_by_name[name] = tool
+    return tools_by_name, renames
+
+def _export_config(config_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return config data in file form: sections in schema order, custom tools as a list."""
+    exported = {key: config_data[key] for key in CONFIG_SECTIONS if key in config_data}
+    exported.update((key, value) for key, value in config_data.items() if key not in exported)
+    
+    custom_tools = exported.get('tools', {}).get('custom')
+    if isinstance(custom_tools, dict):
+        exported['tools'] = {**exported['tools'], 'custom': list(custom_tools.values())}
+    return exported
+
+def _config_digest(config_data: Dict[str, Any]) -> bytes:
+    """Content hash of a configuration, independent of key order."""
+    return hashlib.blake2b(_json_canonical(config_data), digest_size=16).digest()
+
+def validate_config(config_data: Dict[str, Any]) -> tuple[bool, str]:
+    """Validate configuration data."""
+    config_data = _export_config(config_data)
+    try:
+        config_key = _config_digest(config_data)
+    except Exception as e:
+        return False, f"Validation error: {str(e)}"
+    return _validate_cached(config_key, config_data)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _preview_cached(config_key: bytes, _config_data: Dict[str, Any]) -> tuple[str, bytes, bool, str]:
+    """Emit the preview YAML (as text and as download bytes) and validate it; cached on the config's content hash."""
+    yaml_content = yaml.dump(_config_data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, indent=2)
+    return (yaml_content, yaml_content.encode('utf-8'), *_validate_cached(config_key, _config_data))
+
+def _json_sidecar_path(file_path: str) -> Path:
+    """Path of the JSON copy kept next to a YAML configuration."""
+    return Path(f"{file_path}.json")
+
+def _yaml_source_digest(yaml_bytes: bytes) -> str:
+    """Content hash of a YAML file, recorded in its sidecar to detect a stale copy."""
+    return hashlib.blake2b(yaml_bytes, digest_size=16).hexdigest()
+
+def _write_json_sidecar(file_path: str, yaml_bytes: bytes, config_data: Dict[str, Any]):
+    """Write the JSON sidecar, or remove it if the config doesn't survive a JSON round-trip."""
+    sidecar = _json_sidecar_path(file_path)
+    try:
+        payload = _json_dumps({'source_digest': _yaml_source_digest(yaml_bytes), 'config': config_data})
+        if _json_loads(payload)['config'] == config_data:
+            sidecar.write_bytes(payload)
+            return
+    except (TypeError, ValueError, OSError):
+        pass
+    # YAML-native values (dates, non-string keys) would come back changed; always parse the YAML
+    try:
+        sidecar.unlink()
+    except OSError:
+        pass
+
 def save_config_to_file(config_data: Dict[str, Any], file_path: str) -> bool:
-    """Save configuration to YAML file."""
+    """Save configuration to YAML file, plus a JSON sidecar for fast reloads."""
+    config_data = _export_config(config_data)
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False, indent=2)
+        yaml_bytes = yaml.dump(config_data, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, indent=2).encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(yaml_bytes)
+        
+        # The YAML file is authoritative; the sidecar is only a shortcut for reloading it
+        _write_json_sidecar(file_path, yaml_bytes, config_data)
         return True
     except Exception as e:
         st.error(f"Error saving configuration: {str(e)}")
         return False
 
 def load_config_from_file(file_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
+    """Load configuration from a YAML or JSON file, preferring an up-to-date JSON sidecar."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        if file_path.endswith('.json'):
+            return _json_loads(Path(file_path).read_bytes())
+        
+        with open(file_path, 'rb') as f:
+            yaml_bytes = f.read()
+        
+        # Hashing the YAML is far cheaper than parsing it; use the sidecar only if it was made from these bytes
+        try:
+            sidecar = _json_loads(_json_sidecar_path(file_path).read_bytes())
+            if sidecar['source_digest'] == _yaml_source_digest(yaml_bytes):
+                return sidecar['config']
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        
+        return yaml.load(yaml_bytes, Loader=YamlLoader)
     except Exception as e:
         st.error(f"Error loading configuration: {str(e)}")
         return {}
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _load_config_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a configuration file; cached per path, modification time and size."""
+    return load_config_from_file(file_path)
+
+def load_template_config(file_path: Path) -> Dict[str, Any]:
+    """Load a template configuration, reusing the parsed result until the file changes."""
+    try:
+        stat = os.stat(file_path)
+    except OSError as e:
+        st.error(f"Error loading configuration: {str(e)}")
+        return {}
+    return _load_config_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+@st.fragment
 def render_agent_info_form():
     """Render agent information form."""
+    cfg = _section_reader('agent')
     st.subheader("Agent Information")
     
     col1, col2 = st.columns(2)
     
     with col1:
         name = st.text_input("Agent Name", 
-                           value=st.session_state.config_data.get('agent', {}).get('name', ''),
+                           value=cfg('name', default=''),
                            help="A descriptive name for your agent")
         
         version = st.text_input("Version", 
-                              value=st.session_state.config_data.get('agent', {}).get('version', '1.0.0'),
+                              value=cfg('version', default='1.0.0'),
                               help="Version number for your agent")
     
     with col2:
         description = st.text_area("Description", 
-                                 value=st.session_state.config_data.get('agent', {}).get('description', ''),
+                                 value=cfg('description', default=''),
                                  help="Detailed description of what your agent does",
                                  height=100)
     
     # Update session state
-    if 'agent' not in st.session_state.config_data:
-        st.session_state.config_data['agent'] = {}
-    
-    st.session_state.config_data['agent']['name'] = name
-    st.session_state.config_data['agent']['description'] = description
-    st.session_state.config_data['agent']['version'] = version
+    _update_section('agent', {'name': name, 'description': description, 'version': version})
 
+@st.fragment
 def render_llm_config_form():
     """Render LLM configuration form."""
+    cfg = _section_reader('llm')
     st.subheader("LLM Configuration")
     
     models = get_available_models()
+    providers, provider_index, model_index = get_model_indices()
     
     col1, col2 = st.columns(2)
     
     with col1:
         provider = st.selectbox("LLM Provider", 
-                              options=list(models.keys()),
-                              index=list(models.keys()).index(st.session_state.config_data.get('llm', {}).get('provider', 'openai')) if st.session_state.config_data.get('llm', {}).get('provider') in models else 0,
+                              options=providers,
+                              index=provider_index.get(cfg('provider'), 0),
                               help="Choose your LLM provider")
         
         model = st.selectbox("Model", 
                            options=models[provider],
-                           index=models[provider].index(st.session_state.config_data.get('llm', {}).get('model', models[provider][0])) if st.session_state.config_data.get('llm', {}).get('model') in models[provider] else 0,
+                           index=model_index[provider].get(cfg('model'), 0),
                            help="Select the specific model to use")
         
         api_key_env = st.text_input("API Key Environment Variable", 
-                                  value=st.session_state.config_data.get('llm', {}).get('api_key_env', f"{provider.upper()}_API_KEY"),
+                                  value=cfg('api_key_env', default=f"{provider.upper()}_API_KEY"),
                                   help="Name of environment variable containing your API key")
     
     with col2:
         temperature = st.slider("Temperature", 
                               min_value=0.0, max_value=2.0, 
-                              value=st.session_state.config_data.get('llm', {}).get('temperature', 0.7),
+                              value=cfg('temperature', default=0.7),
                               step=0.1,
                               help="Controls randomness in responses")
         
         max_tokens = st.number_input("Max Tokens", 
                                    min_value=1, max_value=128000,
-                                   value=st.session_state.config_data.get('llm', {}).get('max_tokens', 4000),
+                                   value=cfg('max_tokens', default=4000),
                                    help="Maximum number of tokens in response")
         
         base_url = st.text_input("Base URL (Optional)", 
-                               value=st.session_state.config_data.get('llm', {}).get('base_url', ''),
+                               value=cfg('base_url', default=''),
                                help="Custom base URL for API endpoint")
     
     # Update session state
-    if 'llm' not in st.session_state.config_data:
-        st.session_state.config_data['llm'] = {}
-    
-    st.session_state.config_data['llm']['provider'] = provider
-    st.session_state.config_data['llm']['model'] = model
-    st.session_state.config_data['llm']['temperature'] = temperature
-    st.session_state.config_data['llm']['max_tokens'] = max_tokens
-    st.session_state.config_data['llm']['api_key_env'] = api_key_env
+    llm_values = {
+        'provider': provider,
+        'model': model,
+        'temperature': temperature,
+        'max_tokens': max_tokens,
+        'api_key_env': api_key_env
+    }
     if base_url:
-        st.session_state.config_data['llm']['base_url'] = base_url
+        llm_values['base_url'] = base_url
+    _update_section('llm', llm_values)
 
+@st.fragment
 def render_prompts_config_form():
     """Render prompts configuration form."""
+    cfg = _section_reader('prompts')
     st.subheader("Prompts Configuration")
     
     # System Prompt
     st.write("**System Prompt**")
     system_template = st.text_area("System Prompt Template", 
-                                 value=st.session_state.config_data.get('prompts', {}).get('system_prompt', {}).get('template', ''),
+                                 value=cfg('system_prompt', 'template', default=''),
                                  height=150,
                                  help="The system prompt that defines the agent's role and behavior")
     
     system_variables = st.text_input("System Prompt Variables (comma-separated)", 
-                                   value=', '.join(st.session_state.config_data.get('prompts', {}).get('system_prompt', {}).get('variables', [])),
+                                   value=', '.join(cfg('system_prompt', 'variables', default=[])),
                                    help="Variables that can be substituted in the system prompt")
     
     # User Prompt
     st.write("**User Prompt**")
     user_template = st.text_area("User Prompt Template", 
-                                value=st.session_state.config_data.get('prompts', {}).get('user_prompt', {}).get('template', ''),
+                                value=cfg('user_prompt', 'template', default=''),
                                 height=100,
                                 help="Template for formatting user inputs")
     
     user_variables = st.text_input("User Prompt Variables (comma-separated)", 
-                                 value=', '.join(st.session_state.config_data.get('prompts', {}).get('user_prompt', {}).get('variables', [])),
+                                 value=', '.join(cfg('user_prompt', 'variables', default=[])),
                                  help="Variables that can be substituted in the user prompt")
     
     # Tool Prompt (Optional)
     st.write("**Tool Prompt (Optional)**")
     tool_template = st.text_area("Tool Prompt Template", 
-                                value=st.session_state.config_data.get('prompts', {}).get('tool_prompt', {}).get('template', ''),
+                                value=cfg('tool_prompt', 'template', default=''),
                                 height=100,
                                 help="Template for tool usage instructions")
     
     tool_variables = st.text_input("Tool Prompt Variables (comma-separated)", 
-                                 value=', '.join(st.session_state.config_data.get('prompts', {}).get('tool_prompt', {}).get('variables', [])) if st.session_state.config_data.get('prompts', {}).get('tool_prompt') else '',
+                                 value=', '.join(cfg('tool_prompt', 'variables', default=[])) if cfg('tool_prompt') else '',
                                  help="Variables that can be substituted in the tool prompt")
     
     # Update session state
-    if 'prompts' not in st.session_state.config_data:
-        st.session_state.config_data['prompts'] = {}
-    
-    st.session_state.config_data['prompts']['system_prompt'] = {
-        'template': system_template,
-        'variables': [v.strip() for v in system_variables.split(',') if v.strip()]
-    }
-    
-    st.session_state.config_data['prompts']['user_prompt'] = {
-        'template': user_template,
-        'variables': [v.strip() for v in user_variables.split(',') if v.strip()]
+    prompt_values = {
+        'system_prompt': {
+            'template': system_template,
+            'variables': [v.strip() for v in system_variables.split(',') if v.strip()]
+        },
+        'user_prompt': {
+            'template': user_template,
+            'variables': [v.strip() for v in user_variables.split(',') if v.strip()]
+        }
     }
     
     if tool_template:
-        st.session_state.config_data['prompts']['tool_prompt'] = {
+        prompt_values['tool_prompt'] = {
             'template': tool_template,
             'variables': [v.strip() for v in tool_variables.split(',') if v.strip()]
         }
+    _update_section('prompts', prompt_values)
 
+@st.cache_data(show_spinner=False, max_entries=8)
+def _custom_tool_columns(custom_tools_json: bytes) -> Dict[str, tuple]:
+    """Display fields of the custom tools as parallel columns, formatted once per distinct tool set."""
+    tools = _json_loads(custom_tools_json)
+    return {
+        'ids': tuple(tools),
+        'names': tuple(tool.get('name', '') for tool in tools.values()),
+        'modules': tuple(tool.get('module_path', '') for tool in tools.values()),
+        'classes': tuple(tool.get('class_name', '') for tool in tools.values()),
+        'descriptions': tuple(tool.get('description', '') for tool in tools.values()),
+        'parameters': tuple(_json_pretty(tool['parameters']) if tool.get('parameters') else ''
+                            for tool in tools.values()),
+    }
+
+@st.fragment
 def render_tools_config_form():
     """Render tools configuration form."""
+    cfg = _section_reader('tools')
     st.subheader("Tools Configuration")
     
     # Built-in Tools
     st.write("**Built-in Tools**")
     available_tools = get_built_in_tools()
-    current_built_in = st.session_state.config_data.get('tools', {}).get('built_in', [])
+    current_built_in = cfg('built_in', default=[])
     
     selected_tools = st.multiselect("Select Built-in Tools", 
                                   options=available_tools,
@@ -430,13 +548,16 @@ def render_tools_config_form():
     # Custom Tools
     st.write("**Custom Tools**")
     
-    # Initialize custom tools in session state
-    if 'tools' not in st.session_state.config_data:
-        st.session_state.config_data['tools'] = {}
-    if 'custom' not in st.session_state.config_data['tools']:
-        st.session_state.config_data['tools']['custom'] = []
-    
-    custom_tools = st.session_state.config_data['tools']['custom']
+    # Initialize custom tools in session state, keyed by tool name
+    tools_config = st.session_state.config_data.setdefault('tools', {})
+    custom_tools = tools_config.get('custom')
+    if not isinstance(custom_tools, dict):
+        # Converted once per loaded config; keep any renames on show until the next load
+        custom_tools, st.session_state.custom_tool_renames = _custom_tools_by_name(custom_tools)
+        tools_config['custom'] = custom_tools
+    if st.session_state.get('custom_tool_renames'):
+        st.warning("Custom tools with an empty or duplicate name were renamed: "
+                   + ", ".join(st.session_state.custom_tool_renames))
     
     # Add new custom tool
     with st.expander("Add Custom Tool"):
@@ -451,7 +572,7 @@ def render_tools_config_form():
         
         if st.button("Add Custom Tool"):
             try:
-                params = json.loads(new_tool_params) if new_tool_params.strip() else {}
+                params = _json_loads(new_tool_params) if new_tool_params.strip() else {}
                 new_tool = {
                     'name': new_tool_name,
                     'module_path': new_tool_module,
@@ -459,117 +580,123 @@ def render_tools_config_form():
                     'description': new_tool_description,
                     'parameters': params
                 }
-                custom_tools.append(new_tool)
-                st.success(f"Added custom tool: {new_tool_name}")
-                st.rerun()
-            except json.JSONDecodeError:
+                if new_tool_name in custom_tools:
+                    st.error(f"A custom tool named '{new_tool_name}' already exists")
+                else:
+                    custom_tools[new_tool_name] = new_tool
+                    st.success(f"Added custom tool: {new_tool_name}")
+                    st.rerun()
+            except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
                 st.error("Invalid JSON format in parameters")
     
     # Display existing custom tools
     if custom_tools:
         st.write("**Existing Custom Tools**")
-        for i, tool in enumerate(custom_tools):
-            with st.expander(f"Custom Tool: {tool['name']}"):
+        columns = _custom_tool_columns(_json_dumps(custom_tools))
+        for tool_id, name, module_path, class_name, description, parameters in zip(*columns.values()):
+            with st.expander(f"Custom Tool: {name}"):
                 col1, col2 = st.columns([4, 1])
                 with col1:
-                    st.write(f"**Module:** {tool['module_path']}")
-                    st.write(f"**Class:** {tool['class_name']}")
-                    st.write(f"**Description:** {tool['description']}")
-                    if tool.get('parameters'):
-                        st.write(f"**Parameters:** {json.dumps(tool['parameters'], indent=2)}")
+                    st.write(f"**Module:** {module_path}")
+                    st.write(f"**Class:** {class_name}")
+                    st.write(f"**Description:** {description}")
+                    if parameters:
+                        st.write(f"**Parameters:** {parameters}")
                 with col2:
-                    if st.button("Remove", key=f"remove_tool_{i}"):
-                        custom_tools.pop(i)
+                    if st.button("Remove", key=f"remove_tool_{tool_id}"):
+                        del custom_tools[tool_id]
                         st.rerun()
     
     # Update session state
-    st.session_state.config_data['tools']['built_in'] = selected_tools
-    st.session_state.config_data['tools']['custom'] = custom_tools
+    _update_section('tools', {'built_in': selected_tools, 'custom': custom_tools})
 
+@st.fragment
 def render_memory_config_form():
     """Render memory configuration form."""
+    cfg = _section_reader('memory')
     st.subheader("Memory Configuration")
     
     col1, col2 = st.columns(2)
     
     with col1:
         memory_enabled = st.checkbox("Enable Memory", 
-                                   value=st.session_state.config_data.get('memory', {}).get('enabled', False),
+                                   value=cfg('enabled', default=False),
                                    help="Enable memory functionality for the agent")
         
         if memory_enabled:
             provider = st.selectbox("Memory Provider", 
-                                  options=["langmem", "custom"],
-                                  index=0 if st.session_state.config_data.get('memory', {}).get('provider', 'langmem') == 'langmem' else 1,
+                                  options=MEMORY_PROVIDERS,
+                                  index=MEMORY_PROVIDER_INDEX.get(cfg('provider', default='langmem'), 1),
                                   help="Choose memory provider")
             
             st.write("**Memory Types**")
             semantic = st.checkbox("Semantic Memory", 
-                                 value=st.session_state.config_data.get('memory', {}).get('types', {}).get('semantic', True),
+                                 value=cfg('types', 'semantic', default=True),
                                  help="Store facts and knowledge")
             
             episodic = st.checkbox("Episodic Memory", 
-                                 value=st.session_state.config_data.get('memory', {}).get('types', {}).get('episodic', True),
+                                 value=cfg('types', 'episodic', default=True),
                                  help="Store conversation history")
             
             procedural = st.checkbox("Procedural Memory", 
-                                   value=st.session_state.config_data.get('memory', {}).get('types', {}).get('procedural', True),
+                                   value=cfg('types', 'procedural', default=True),
                                    help="Store learned patterns")
     
     with col2:
         if memory_enabled:
             st.write("**Storage Configuration**")
             backend = st.selectbox("Storage Backend", 
-                                 options=["memory", "postgres", "redis"],
-                                 index=["memory", "postgres", "redis"].index(st.session_state.config_data.get('memory', {}).get('storage', {}).get('backend', 'memory')),
+                                 options=STORAGE_BACKENDS,
+                                 index=STORAGE_BACKEND_INDEX.get(cfg('storage', 'backend', default='memory'), 0),
                                  help="Choose storage backend")
             
             connection_string = st.text_input("Connection String (Optional)", 
-                                            value=st.session_state.config_data.get('memory', {}).get('storage', {}).get('connection_string', ''),
+                                            value=cfg('storage', 'connection_string', default=''),
                                             help="Database connection string if using external storage")
             
             st.write("**Memory Settings**")
             max_memory_size = st.number_input("Max Memory Size", 
                                             min_value=1000, max_value=100000,
-                                            value=st.session_state.config_data.get('memory', {}).get('settings', {}).get('max_memory_size', 10000),
+                                            value=cfg('settings', 'max_memory_size', default=10000),
                                             help="Maximum number of memory items")
             
             retention_days = st.number_input("Retention Days", 
                                            min_value=1, max_value=365,
-                                           value=st.session_state.config_data.get('memory', {}).get('settings', {}).get('retention_days', 30),
+                                           value=cfg('settings', 'retention_days', default=30),
                                            help="How long to keep memories")
             
             background_processing = st.checkbox("Background Processing", 
-                                              value=st.session_state.config_data.get('memory', {}).get('settings', {}).get('background_processing', True),
+                                              value=cfg('settings', 'background_processing', default=True),
                                               help="Enable background memory processing")
     
     # Update session state
-    if 'memory' not in st.session_state.config_data:
-        st.session_state.config_data['memory'] = {}
-    
-    st.session_state.config_data['memory']['enabled'] = memory_enabled
+    memory_values = {'enabled': memory_enabled}
     
     if memory_enabled:
-        st.session_state.config_data['memory']['provider'] = provider
-        st.session_state.config_data['memory']['types'] = {
-            'semantic': semantic,
-            'episodic': episodic,
-            'procedural': procedural
-        }
-        st.session_state.config_data['memory']['storage'] = {
-            'backend': backend
-        }
+        storage = {'backend': backend}
         if connection_string:
-            st.session_state.config_data['memory']['storage']['connection_string'] = connection_string
+            storage['connection_string'] = connection_string
         
-        st.session_state.config_data['memory']['settings'] = {
-            'max_memory_size': max_memory_size,
-            'retention_days': retention_days,
-            'background_processing': background_processing
-        }
+        memory_values.update({
+            'provider': provider,
+            'types': {
+                'semantic': semantic,
+                'episodic': episodic,
+                'procedural': procedural
+            },
+            'storage': storage,
+            'settings': {
+                'max_memory_size': max_memory_size,
+                'retention_days': retention_days,
+                'background_processing': background_processing
+            }
+        })
+    _update_section('memory', memory_values)
 
+@st.fragment
 def render_react_config_form():
     """Render ReAct configuration form."""
+    cfg = _section_reader('react')
     st.subheader("ReAct Configuration")
     
     col1, col2 = st.columns(2)
@@ -577,28 +704,26 @@ def render_react_config_form():
     with col1:
         max_iterations = st.number_input("Max Iterations", 
                                        min_value=1, max_value=100,
-                                       value=st.session_state.config_data.get('react', {}).get('max_iterations', 10),
+                                       value=cfg('max_iterations', default=10),
                                        help="Maximum reasoning/acting cycles")
     
     with col2:
         recursion_limit = st.number_input("Recursion Limit", 
                                         min_value=10, max_value=200,
-                                        value=st.session_state.config_data.get('react', {}).get('recursion_limit', 50),
+                                        value=cfg('recursion_limit', default=50),
                                         help="Maximum recursion depth")
     
     # Update session state
-    if 'react' not in st.session_state.config_data:
-        st.session_state.config_data['react'] = {}
-    
-    st.session_state.config_data['react']['max_iterations'] = max_iterations
-    st.session_state.config_data['react']['recursion_limit'] = recursion_limit
+    _update_section('react', {'max_iterations': max_iterations, 'recursion_limit': recursion_limit})
 
+@st.fragment
 def render_optimization_config_form():
     """Render optimization configuration form."""
+    cfg = _section_reader('optimization')
     st.subheader("Optimization Configuration")
     
     optimization_enabled = st.checkbox("Enable Optimization", 
-                                     value=st.session_state.config_data.get('optimization', {}).get('enabled', False),
+                                     value=cfg('enabled', default=False),
                                      help="Enable optimization features")
     
     if optimization_enabled:
@@ -607,54 +732,51 @@ def render_optimization_config_form():
         with col1:
             st.write("**Prompt Optimization**")
             prompt_opt_enabled = st.checkbox("Enable Prompt Optimization", 
-                                           value=st.session_state.config_data.get('optimization', {}).get('prompt_optimization', {}).get('enabled', False))
+                                           value=cfg('prompt_optimization', 'enabled', default=False))
             
             feedback_collection = st.checkbox("Feedback Collection", 
-                                            value=st.session_state.config_data.get('optimization', {}).get('prompt_optimization', {}).get('feedback_collection', False))
+                                            value=cfg('prompt_optimization', 'feedback_collection', default=False))
             
             ab_testing = st.checkbox("A/B Testing", 
-                                   value=st.session_state.config_data.get('optimization', {}).get('prompt_optimization', {}).get('ab_testing', False))
+                                   value=cfg('prompt_optimization', 'ab_testing', default=False))
             
             optimization_frequency = st.selectbox("Optimization Frequency", 
-                                                options=["daily", "weekly", "monthly"],
-                                                index=["daily", "weekly", "monthly"].index(st.session_state.config_data.get('optimization', {}).get('prompt_optimization', {}).get('optimization_frequency', 'weekly')))
+                                                options=OPTIMIZATION_FREQUENCIES,
+                                                index=OPTIMIZATION_FREQUENCY_INDEX.get(cfg('prompt_optimization', 'optimization_frequency', default='weekly'), 1))
         
         with col2:
             st.write("**Performance Tracking**")
             perf_tracking_enabled = st.checkbox("Enable Performance Tracking", 
-                                              value=st.session_state.config_data.get('optimization', {}).get('performance_tracking', {}).get('enabled', False))
+                                              value=cfg('performance_tracking', 'enabled', default=False))
             
             if perf_tracking_enabled:
-                available_metrics = ["response_time", "accuracy", "user_satisfaction", "source_quality", "resolution_rate", "customer_satisfaction", "escalation_rate", "code_quality", "execution_success"]
-                current_metrics = st.session_state.config_data.get('optimization', {}).get('performance_tracking', {}).get('metrics', ["response_time", "accuracy", "user_satisfaction"])
+                current_metrics = cfg('performance_tracking', 'metrics', default=DEFAULT_PERFORMANCE_METRICS)
                 
                 selected_metrics = st.multiselect("Performance Metrics", 
-                                                options=available_metrics,
-                                                default=[metric for metric in current_metrics if metric in available_metrics])
+                                                options=PERFORMANCE_METRICS,
+                                                default=[metric for metric in current_metrics if metric in PERFORMANCE_METRIC_SET])
     
     # Update session state
-    if 'optimization' not in st.session_state.config_data:
-        st.session_state.config_data['optimization'] = {}
-    
-    st.session_state.config_data['optimization']['enabled'] = optimization_enabled
+    optimization_values = {'enabled': optimization_enabled}
     
     if optimization_enabled:
-        st.session_state.config_data['optimization']['prompt_optimization'] = {
+        performance_tracking = {'enabled': perf_tracking_enabled}
+        if perf_tracking_enabled:
+            performance_tracking['metrics'] = selected_metrics
+        
+        optimization_values['prompt_optimization'] = {
             'enabled': prompt_opt_enabled,
             'feedback_collection': feedback_collection,
             'ab_testing': ab_testing,
             'optimization_frequency': optimization_frequency
         }
-        
-        st.session_state.config_data['optimization']['performance_tracking'] = {
-            'enabled': perf_tracking_enabled
-        }
-        
-        if perf_tracking_enabled:
-            st.session_state.config_data['optimization']['performance_tracking']['metrics'] = selected_metrics
+        optimization_values['performance_tracking'] = performance_tracking
+    _update_section('optimization', optimization_values)
 
+@st.fragment
 def render_runtime_config_form():
     """Render runtime configuration form."""
+    cfg = _section_reader('runtime')
     st.subheader("Runtime Configuration")
     
     col1, col2 = st.columns(2)
@@ -662,43 +784,45 @@ def render_runtime_config_form():
     with col1:
         max_iterations = st.number_input("Max Iterations", 
                                        min_value=1, max_value=200,
-                                       value=st.session_state.config_data.get('runtime', {}).get('max_iterations', 50),
+                                       value=cfg('max_iterations', default=50),
                                        help="Maximum iterations for agent execution")
         
         timeout_seconds = st.number_input("Timeout (seconds)", 
                                         min_value=10, max_value=3600,
-                                        value=st.session_state.config_data.get('runtime', {}).get('timeout_seconds', 300),
+                                        value=cfg('timeout_seconds', default=300),
                                         help="Maximum execution time in seconds")
     
     with col2:
         retry_attempts = st.number_input("Retry Attempts", 
                                        min_value=0, max_value=10,
-                                       value=st.session_state.config_data.get('runtime', {}).get('retry_attempts', 3),
+                                       value=cfg('retry_attempts', default=3),
                                        help="Number of retry attempts on failure")
         
         debug_mode = st.checkbox("Debug Mode", 
-                               value=st.session_state.config_data.get('runtime', {}).get('debug_mode', False),
+                               value=cfg('debug_mode', default=False),
                                help="Enable debug mode for detailed logging")
     
     # Update session state
-    if 'runtime' not in st.session_state.config_data:
-        st.session_state.config_data['runtime'] = {}
-    
-    st.session_state.config_data['runtime']['max_iterations'] = max_iterations
-    st.session_state.config_data['runtime']['timeout_seconds'] = timeout_seconds
-    st.session_state.config_data['runtime']['retry_attempts'] = retry_attempts
-    st.session_state.config_data['runtime']['debug_mode'] = debug_mode
+    _update_section('runtime', {
+        'max_iterations': max_iterations,
+        'timeout_seconds': timeout_seconds,
+        'retry_attempts': retry_attempts,
+        'debug_mode': debug_mode
+    })
 
 def render_yaml_preview():
     """Render YAML preview and validation."""
     st.subheader("Configuration Preview")
     
-    # Generate YAML
+    # Without tab state (older Streamlit) this tab isn't rerun when opened, and the
+    # form fragments rerun on their own; a full rerun picks up their edits here
+    if "main_tab" not in st.session_state:
+        st.button("🔄 Refresh Preview", help="Update the preview with edits made in the other tabs")
+    
+    # Generate and validate YAML, reusing the previous result while the config is unchanged
     try:
-        yaml_content = yaml.dump(st.session_state.config_data, default_flow_style=False, sort_keys=False, indent=2)
-        
-        # Validate configuration
-        is_valid, validation_message = validate_config(st.session_state.config_data)
+        config_data = _export_config(st.session_state.config_data)
+        yaml_content, yaml_bytes, is_valid, validation_message = _preview_cached(_config_digest(config_data), config_data)
         
         if is_valid:
             st.success(validation_message)
@@ -711,9 +835,9 @@ def render_yaml_preview():
         # Download button
         st.download_button(
             label="Download Configuration",
-            data=yaml_content,
-            file_name=f"agent_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yml",
-            mime="text/yaml"
+            data=yaml_bytes,
+            file_name=f"agent_config_{st.session_state.session_timestamp}.yml",
+            mime="application/x-yaml"
         )
         
         return yaml_content
@@ -733,13 +857,15 @@ def render_file_operations():
         
         st.info("💡 Agent templates are available in the sidebar under 'Quick Templates'")
         
-        # Upload custom config
-        
-        # Upload custom config
+        # Upload custom config; the uploader keeps its file across reruns, so only
+        # parse (and replace the current config) when a different file is uploaded
         uploaded_file = st.file_uploader("Upload Configuration File", type=['yml', 'yaml'])
-        if uploaded_file is not None:
+        if uploaded_file is not None and uploaded_file.file_id != st.session_state.get('uploaded_file_id'):
             try:
-                config_data = yaml.safe_load(uploaded_file.read())
+                # Let the scanner read straight from the upload buffer instead of a bytes copy
+                uploaded_file.seek(0)
+                config_data = yaml.load(uploaded_file, Loader=YamlLoader)
+                st.session_state.uploaded_file_id = uploaded_file.file_id
                 st.session_state.config_data = config_data
                 st.session_state.current_config_file = uploaded_file.name
                 st.success(f"Loaded configuration from {uploaded_file.name}")
@@ -751,7 +877,7 @@ def render_file_operations():
         st.write("**Save Configuration**")
         
         save_filename = st.text_input("Save as filename", 
-                                    value=f"my_agent_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yml")
+                                    value=f"my_agent_config_{st.session_state.session_timestamp}.yml")
         
         if st.button("Save Configuration"):
             if st.session_state.config_data:
@@ -766,6 +892,27 @@ def render_file_operations():
             else:
                 st.warning("No configuration to save")
 
+def _create_agent(config_data: Dict[str, Any]) -> "ConfigurableAgent":
+    """Build an agent from the current config, via a temporary YAML file that is removed afterwards."""
+    from src.core.configurable_agent import ConfigurableAgent
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
+        yaml.dump(_export_config(config_data), f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, indent=2)
+        temp_config_file = f.name
+    
+    try:
+        return ConfigurableAgent(temp_config_file)
+    finally:
+        os.unlink(temp_config_file)
+
+def _run_agent(agent: "ConfigurableAgent", input_text: str) -> Dict[str, Any]:
+    """Run the agent through its async entry point on a fresh event loop."""
+    loop = _new_event_loop()
+    try:
+        return loop.run_until_complete(agent.arun(input_text))
+    finally:
+        loop.close()
+
 def render_agent_testing():
     """Render agent testing interface."""
     st.subheader("Test Agent")
@@ -774,66 +921,80 @@ def render_agent_testing():
         st.warning("Please configure your agent first")
         return
     
-    # Validate configuration
-    is_valid, validation_message = validate_config(st.session_state.config_data)
+    # Validate configuration; its content hash also identifies the agent built from it
+    config_data = _export_config(st.session_state.config_data)
+    config_key = _config_digest(config_data)
+    is_valid, validation_message = _validate_cached(config_key, config_data)
     if not is_valid:
         st.error(f"Cannot test agent: {validation_message}")
         return
     
-    # Save temporary config file for testing
-    temp_config_file = None
-    try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(st.session_state.config_data, f, default_flow_style=False)
-            temp_config_file = f.name
-        
-        # Initialize agent
-        if st.button("Initialize Agent"):
+    # Initialize agent, reusing this session's agent while the config is unchanged
+    if st.button("Initialize Agent"):
+        if st.session_state.agent_instance and st.session_state.agent_config_key == config_key:
+            st.success("Agent is already initialized with this configuration")
+        else:
             try:
-                st.session_state.agent_instance = ConfigurableAgent(temp_config_file)
+                st.session_state.agent_instance = _create_agent(st.session_state.config_data)
+                st.session_state.agent_config_key = config_key
                 st.success("Agent initialized successfully!")
             except Exception as e:
                 st.error(f"Error initializing agent: {str(e)}")
                 st.session_state.agent_instance = None
-        
-        # Test interface
-        if st.session_state.agent_instance:
-            st.write("**Agent Ready for Testing**")
-            
-            test_input = st.text_area("Enter your test message:", 
-                                    height=100,
-                                    placeholder="Ask your agent a question or give it a task...")
-            
-            col1, col2 = st.columns([1, 4])
-            
-            with col1:
-                if st.button("Send Message", type="primary"):
-                    if test_input:
-                        with st.spinner("Agent is thinking..."):
-                            try:
-                                response = st.session_state.agent_instance.run(test_input)
-                                
-                                st.write("**Agent Response:**")
-                                st.write(response.get('response', 'No response'))
-                                
-                                # Show additional details in expander
-                                with st.expander("Response Details"):
-                                    st.json(response)
-                                
-                            except Exception as e:
-                                st.error(f"Error running agent: {str(e)}")
-                    else:
-                        st.warning("Please enter a message")
-            
-            with col2:
-                if st.button("Clear Agent"):
-                    st.session_state.agent_instance = None
-                    st.rerun()
     
-    finally:
-        # Clean up temporary file
-        if temp_config_file and os.path.exists(temp_config_file):
-            os.unlink(temp_config_file)
+    # Test interface
+    if st.session_state.agent_instance:
+        st.write("**Agent Ready for Testing**")
+        
+        test_input = st.text_area("Enter your test message:", 
+                                height=100,
+                                placeholder="Ask your agent a question or give it a task...")
+        
+        stream_response = st.checkbox("Stream response", value=True,
+                                      help="Show the response as it is generated; turn off to see full response details")
+        
+        col1, col2 = st.columns([1, 4])
+        
+        with col1:
+            if st.button("Send Message", type="primary"):
+                if test_input:
+                    try:
+                        if stream_response:
+                            st.write("**Agent Response:**")
+                            st.write_stream(st.session_state.agent_instance.stream(test_input))
+                        else:
+                            with st.spinner("Agent is thinking..."):
+                                response = _run_agent(st.session_state.agent_instance, test_input)
+                            
+                            st.write("**Agent Response:**")
+                            st.write(response.get('response', 'No response'))
+                            
+                            # Show additional details in expander
+                            with st.expander("Response Details"):
+                                st.code(_json_pretty(response), language='json')
+                        
+                    except Exception as e:
+                        st.error(f"Error running agent: {str(e)}")
+                else:
+                    st.warning("Please enter a message")
+        
+        with col2:
+            if st.button("Clear Agent"):
+                st.session_state.agent_instance = None
+                st.rerun()
+
+# Available worker configs
+WORKER_CONFIGS: Final = {
+    "Web Researcher": "configs/examples/research_agent.yml",
+    "Coding Assistant": "configs/examples/coding_assistant.yml",
+    "Customer Support": "configs/examples/customer_support.yml",
+    "Gemini Analyst": "configs/examples/gemini_agent.yml",
+    "Groq Coder": "configs/examples/groq_agent.yml"
+}
+WORKER_DEFAULT_NAMES: Final = {k: k.lower().replace(" ", "_") for k in WORKER_CONFIGS}
+
+HIERARCHICAL_EXAMPLE = Path("examples/hierarchical_agent_example.py")
+EXAMPLE_TIMEOUT_SECONDS = 60
 
 def render_hierarchical_agent_management():
     """Render hierarchical agent management interface."""
@@ -841,9 +1002,11 @@ def render_hierarchical_agent_management():
     
     st.write("Create and manage hierarchical agent teams with multiple specialized workers.")
     
-    # Initialize hierarchical team in session state
+    # Initialize hierarchical team in session state; the version is bumped whenever
+    # the team's structure changes so its hierarchy summary can be reused until then
     if 'hierarchical_team' not in st.session_state:
         st.session_state.hierarchical_team = None
+        st.session_state.hierarchical_team_version = 0
     
     col1, col2 = st.columns(2)
     
@@ -856,8 +1019,8 @@ def render_hierarchical_agent_management():
         
         if st.button("Create Hierarchical Team", type="primary"):
             try:
-                from src.hierarchical import HierarchicalAgentTeam
-                st.session_state.hierarchical_team = HierarchicalAgentTeam(name=team_name)
+                st.session_state.hierarchical_team = get_hierarchical_team_class()(name=team_name)
+                st.session_state.hierarchical_team_version += 1
                 st.success(f"Created hierarchical team: {team_name}")
             except ImportError as e:
                 st.error(f"Hierarchical modules not available: {str(e)}")
@@ -869,20 +1032,11 @@ def render_hierarchical_agent_management():
         st.write("**Add Workers**")
         
         if st.session_state.hierarchical_team:
-            # Available worker configs
-            worker_configs = {
-                "Web Researcher": "configs/examples/research_agent.yml",
-                "Coding Assistant": "configs/examples/coding_assistant.yml",
-                "Customer Support": "configs/examples/customer_support.yml",
-                "Gemini Analyst": "configs/examples/gemini_agent.yml",
-                "Groq Coder": "configs/examples/groq_agent.yml"
-            }
-            
             selected_worker = st.selectbox("Select Worker Type", 
-                                         options=list(worker_configs.keys()))
+                                         options=tuple(WORKER_CONFIGS))
             
             worker_name = st.text_input("Worker Name", 
-                                      value=selected_worker.lower().replace(" ", "_"),
+                                      value=WORKER_DEFAULT_NAMES[selected_worker],
                                       help="Name for this worker agent")
             
             team_name = st.selectbox("Team Name", 
@@ -893,9 +1047,10 @@ def render_hierarchical_agent_management():
                 try:
                     worker = st.session_state.hierarchical_team.create_worker_from_config(
                         name=worker_name,
-                        config_file=worker_configs[selected_worker],
+                        config_file=WORKER_CONFIGS[selected_worker],
                         team_name=team_name
                     )
+                    st.session_state.hierarchical_team_version += 1
                     st.success(f"Added {worker_name} to {team_name} team")
                     st.rerun()
                 except Exception as e:
@@ -907,7 +1062,7 @@ def render_hierarchical_agent_management():
     if st.session_state.hierarchical_team:
         st.write("**Team Information**")
         
-        hierarchy_info = st.session_state.hierarchical_team.get_hierarchy_info()
+        hierarchy_info = _hierarchy_info()
         
         col1, col2, col3 = st.columns(3)
         
@@ -952,7 +1107,7 @@ def render_hierarchical_agent_management():
                         
                         # Show full result
                         with st.expander("Full Result"):
-                            st.json(result)
+                            st.code(_json_pretty(result), language='json')
                         
                     except Exception as e:
                         st.error(f"Error running hierarchical team: {str(e)}")
@@ -968,7 +1123,7 @@ def render_hierarchical_agent_management():
         if st.button("Load Hierarchical Template", use_container_width=True):
             example_path = Path("configs/examples/hierarchical_research_team.yml")
             if example_path.exists():
-                config_data = load_config_from_file(str(example_path))
+                config_data = load_template_config(example_path)
                 if config_data:
                     st.session_state.config_data = config_data
                     st.session_state.current_config_file = str(example_path)
@@ -976,96 +1131,112 @@ def render_hierarchical_agent_management():
     
     with col2:
         if st.button("Run Hierarchical Example", use_container_width=True):
-            try:
-                import subprocess
-                result = subprocess.run([
-                    sys.executable, "examples/hierarchical_agent_example.py"
-                ], capture_output=True, text=True, timeout=60)
-                
-                if result.returncode == 0:
-                    st.success("Hierarchical example completed successfully!")
-                    with st.expander("Example Output"):
-                        st.code(result.stdout)
-                else:
-                    st.error(f"Example failed: {result.stderr}")
-            except subprocess.TimeoutExpired:
-                st.error("Example timed out. This might be due to missing dependencies.")
-                st.info("To run the full example with API calls, install dependencies: pip install -r requirements.txt")
-            except Exception as e:
-                st.error(f"Error running example: {str(e)}")
+            if not HIERARCHICAL_EXAMPLE.exists():
+                st.warning(f"Example script not found: {HIERARCHICAL_EXAMPLE}")
+            else:
+                try:
+                    result = subprocess.run([
+                        sys.executable, str(HIERARCHICAL_EXAMPLE)
+                    ], capture_output=True, text=True, timeout=EXAMPLE_TIMEOUT_SECONDS)
+                    
+                    if result.returncode == 0:
+                        st.success("Hierarchical example completed successfully!")
+                        with st.expander("Example Output"):
+                            st.code(result.stdout)
+                    else:
+                        st.error(f"Example failed: {result.stderr}")
+                except subprocess.TimeoutExpired:
+                    st.error("Example timed out. This might be due to missing dependencies.")
+                    st.info("To run the full example with API calls, install dependencies: pip install -r requirements.txt")
+                except Exception as e:
+                    st.error(f"Error running example: {str(e)}")
+
+
+# Agent templates offered in the sidebar, as files under configs/examples
+AGENT_TEMPLATES: Final = {
+    "🔬 Research Agent": {
+        "file": "research_agent.yml",
+        "description": "Web research and information gathering"
+    },
+    "💻 Coding Assistant": {
+        "file": "coding_assistant.yml", 
+        "description": "Code generation and programming help"
+    },
+    "🎧 Customer Support": {
+        "file": "customer_support.yml",
+        "description": "Customer service and support agent"
+    },
+    "🤖 Gemini Agent": {
+        "file": "gemini_agent.yml",
+        "description": "Google Gemini-powered agent"
+    },
+    "⚡ Groq Agent": {
+        "file": "groq_agent.yml", 
+        "description": "High-speed Groq inference agent"
+    },
+    "🏢 Hierarchical Research Team": {
+        "file": "hierarchical_research_team.yml",
+        "description": "Multi-agent research team"
+    },
+    "🌐 Web Content Team": {
+        "file": "web_content_team.yml",
+        "description": "Hierarchical team with web browser and writer agents"
+    },
+    "🔍 Web Browser Agent": {
+        "file": "web_browser_agent.yml",
+        "description": "Specialized web search and information gathering"
+    },
+    "✍️ Writer Agent": {
+        "file": "writer_agent.yml",
+        "description": "Content creation and writing specialist"
+    }
+}
+
+TEMPLATE_PLACEHOLDER: Final = "Select template..."
+TEMPLATES_DIR: Final = Path("configs/examples")
+
+@st.cache_data(show_spinner=False)
+def _template_options() -> Tuple[str, ...]:
+    """Selectbox options: the placeholder, then templates whose files exist.
     
+    Built from one listing of the templates directory and kept until the
+    templates are reloaded from the sidebar.
+    """
+    try:
+        present = frozenset(entry.name for entry in os.scandir(TEMPLATES_DIR))
+    except OSError:
+        present = frozenset()
+    return (TEMPLATE_PLACEHOLDER,) + tuple(name for name, info in AGENT_TEMPLATES.items()
+                                           if info['file'] in present)
+
 def render_template_selector():
     """Render compact template selector in sidebar."""
     st.sidebar.subheader("🤖 Agent Templates")
     
-    # Define all available templates
-    templates = {
-        "🔬 Research Agent": {
-            "file": "research_agent.yml",
-            "description": "Web research and information gathering"
-        },
-        "💻 Coding Assistant": {
-            "file": "coding_assistant.yml", 
-            "description": "Code generation and programming help"
-        },
-        "🎧 Customer Support": {
-            "file": "customer_support.yml",
-            "description": "Customer service and support agent"
-        },
-        "🤖 Gemini Agent": {
-            "file": "gemini_agent.yml",
-            "description": "Google Gemini-powered agent"
-        },
-        "⚡ Groq Agent": {
-            "file": "groq_agent.yml", 
-            "description": "High-speed Groq inference agent"
-        },
-        "🏢 Hierarchical Research Team": {
-            "file": "hierarchical_research_team.yml",
-            "description": "Multi-agent research team"
-        },
-        "🌐 Web Content Team": {
-            "file": "web_content_team.yml",
-            "description": "Hierarchical team with web browser and writer agents"
-        },
-        "🔍 Web Browser Agent": {
-            "file": "web_browser_agent.yml",
-            "description": "Specialized web search and information gathering"
-        },
-        "✍️ Writer Agent": {
-            "file": "writer_agent.yml",
-            "description": "Content creation and writing specialist"
-        }
-    }
-    
-    # Get available templates
-    available_templates = []
-    for template_name, template_info in templates.items():
-        example_path = Path(f"configs/examples/{template_info['file']}")
-        if example_path.exists():
-            available_templates.append(template_name)
+    template_options = _template_options()
+    available_count = len(template_options) - 1
     
-    if available_templates:
+    if available_count:
         # Template selection dropdown
         selected_template = st.sidebar.selectbox(
             "Choose a template:",
-            options=["Select template..."] + available_templates,
+            options=template_options,
             help="Select a pre-configured agent template to load"
         )
         
         # Show description for selected template
-        if selected_template != "Select template..." and selected_template in templates:
-            st.sidebar.caption(f"📝 {templates[selected_template]['description']}")
+        if selected_template != TEMPLATE_PLACEHOLDER and selected_template in AGENT_TEMPLATES:
+            st.sidebar.caption(f"📝 {AGENT_TEMPLATES[selected_template]['description']}")
         
         # Load button
         col1, col2 = st.sidebar.columns([2, 1])
         with col1:
-            load_disabled = selected_template == "Select template..."
+            load_disabled = selected_template == TEMPLATE_PLACEHOLDER
             if st.button("Load Template", disabled=load_disabled, use_container_width=True):
-                if selected_template in templates:
-                    template_info = templates[selected_template]
-                    example_path = Path(f"configs/examples/{template_info['file']}")
-                    config_data = load_config_from_file(str(example_path))
+                if selected_template in AGENT_TEMPLATES:
+                    template_info = AGENT_TEMPLATES[selected_template]
+                    example_path = TEMPLATES_DIR / template_info['file']
+                    config_data = load_template_config(example_path)
                     if config_data:
                         st.session_state.config_data = config_data
                         st.session_state.current_config_file = str(example_path)
@@ -1073,10 +1244,57 @@ def render_template_selector():
                         st.rerun()
         
         with col2:
-            st.sidebar.caption(f"{len(available_templates)} available")
+            st.sidebar.caption(f"{available_count} available")
     else:
         st.sidebar.warning("No templates found")
+    
+    if st.sidebar.button("🔄 Reload Templates", help=f"Rescan {TEMPLATES_DIR} for template files"):
+        _template_options.clear()
+        st.rerun()
+
+
+def render_preview_and_files():
+    """Render the Preview tab: YAML preview followed by file operations."""
+    render_yaml_preview()
+    st.divider()
+    render_file_operations()
+
+# (label, renderer, lazy) for each main tab, in display order. The config forms
+# always run, since rendering them fills config_data with each section's
+# defaults; the lazy view tabs only run while they are open.
+MAIN_TABS = (
+    ("Agent Info", render_agent_info_form, False),
+    ("LLM Config", render_llm_config_form, False),
+    ("Prompts", render_prompts_config_form, False),
+    ("Tools", render_tools_config_form, False),
+    ("Memory", render_memory_config_form, False),
+    ("ReAct", render_react_config_form, False),
+    ("Optimization", render_optimization_config_form, False),
+    ("Runtime", render_runtime_config_form, False),
+    ("Preview", render_preview_and_files, True),
+    ("Test", render_agent_testing, True),
+    ("Hierarchical", render_hierarchical_agent_management, True),
+)
+
+def _main_tabs() -> Tuple[list, bool]:
+    """Create the main tabs, tracking the selected one where Streamlit supports it.
+    
+    Returns the tabs and whether their open state is tracked.
+    """
+    labels = [label for label, _, _ in MAIN_TABS]
+    try:
+        return st.tabs(labels, key="main_tab", on_change="rerun"), True
+    except TypeError:
+        # Older Streamlit: stateless tabs, every body runs
+        return st.tabs(labels), False
 
+def _debug_expander():
+    """Create the sidebar debug expander, tracking whether it is open where Streamlit supports it."""
+    try:
+        return st.sidebar.expander("🔧 Debug Info", key="debug_expander", on_change="rerun")
+    except TypeError:
+        # Older Streamlit: stateless expander, its body always runs
+        return st.sidebar.expander("🔧 Debug Info")
 
 def main():
     """Main Streamlit application."""
@@ -1092,46 +1310,12 @@ def main():
     else:
         st.sidebar.info("No configuration loaded")
     
-    # Main tabs
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11 = st.tabs([
-        "Agent Info", "LLM Config", "Prompts", "Tools", "Memory", 
-        "ReAct", "Optimization", "Runtime", "Preview", "Test", "Hierarchical"
-    ])
-    
-    with tab1:
-        render_agent_info_form()
-    
-    with tab2:
-        render_llm_config_form()
-    
-    with tab3:
-        render_prompts_config_form()
-    
-    with tab4:
-        render_tools_config_form()
-    
-    with tab5:
-        render_memory_config_form()
-    
-    with tab6:
-        render_react_config_form()
-    
-    with tab7:
-        render_optimization_config_form()
-    
-    with tab8:
-        render_runtime_config_form()
-    
-    with tab9:
-        render_yaml_preview()
-        st.divider()
-        render_file_operations()
-    
-    with tab10:
-        render_agent_testing()
-    
-    with tab11:
-        render_hierarchical_agent_management()
+    # Main tabs; switching tabs reruns the app, so lazy tabs are current when opened
+    tabs, tracked = _main_tabs()
+    for tab, (_, render_tab, lazy) in zip(tabs, MAIN_TABS):
+        if not (lazy and tracked) or tab.open:
+            with tab:
+                render_tab()
     
     # Render compact template selector
     render_template_selector()
@@ -1171,12 +1355,14 @@ def main():
         else:
             st.sidebar.warning("No agent configured yet")
     
-    # Debug section - collapsible with compact styling
+    # Debug section - collapsible with compact styling; only filled in while expanded
     st.sidebar.divider()
-    with st.sidebar.expander("🔧 Debug Info"):
-        st.caption(f"Config: {Path(st.session_state.current_config_file).name if st.session_state.current_config_file else 'None'}")
-        st.caption(f"Data: {'✅' if st.session_state.config_data else '❌'}")
-        st.caption(f"Agent: {'✅' if st.session_state.agent_instance else '❌'}")
+    debug_expander = _debug_expander()
+    if getattr(debug_expander, "open", True):
+        with debug_expander:
+            st.caption(f"Config: {Path(st.session_state.current_config_file).name if st.session_state.current_config_file else 'None'}")
+            st.caption(f"Data: {'✅' if st.session_state.config_data else '❌'}")
+            st.caption(f"Agent: {'✅' if st.session_state.agent_instance else '❌'}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file